@@ -25,19 +25,29 @@ Typical usage example:
 
 import yaml
 import subprocess
+import shutil
+import tempfile
 import docker
-import requests
+import httpx
 from datetime import datetime
 import os
+import random
 import logging
-import json
+import errno
+import hashlib
+import io
+import orjson
 import time
 import paramiko
-from typing import Dict, List, Any, Optional, Tuple
+import shlex
+import textwrap
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import partial
+import select
 import socket
-import ping3
+import struct
+import threading
 from dataclasses import dataclass
 from enum import Enum, auto
 
@@ -53,29 +63,281 @@ class RetryableError(MonitoringError):
 
 
 class CheckStatus(Enum):
-    """監視チェックの状態を表す列挙型"""
+    """監視チェックの状態を表す列挙型
+
+    値はメンバー名と同じ文字列となるため、JSON出力時はそのまま状態名になります。
+    """
+
+    def _generate_next_value_(name, start, count, last_values):
+        return name
+
     OK = auto()
     WARNING = auto()
     ERROR = auto()
     NOT_FOUND = auto()
 
 
-@dataclass
+@dataclass(frozen=True)
 class CheckResult:
     """監視チェック結果を格納するデータクラス
     
+    大量に生成されるため、インスタンスごとの__dict__を持たない
+    イミュータブルなクラスとして定義しています。
+    
     Attributes:
         name: チェック対象の名前
         status: チェックの状態
         timestamp: チェック実行時刻
         details: 詳細情報を含む辞書
     """
+    __slots__ = ('name', 'status', 'timestamp', 'details')
+
     name: str
     status: CheckStatus
     timestamp: str
     details: Dict[str, Any]
 
 
+@dataclass(frozen=True)
+class _HostSpec:
+    """デフォルト設定を反映済みのSSH接続設定
+    
+    Attributes:
+        host: 接続先ホスト
+        port: SSHポート
+        username: SSHユーザー名
+        key_path: SSH秘密鍵のパス
+    """
+    __slots__ = ('host', 'port', 'username', 'key_path')
+
+    host: str
+    port: int
+    username: Optional[str]
+    key_path: Optional[str]
+
+    @property
+    def key(self) -> Tuple[str, int, str]:
+        """SSH接続プールのキー"""
+        return self.host, self.port, self.username
+
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# libyamlが利用可能な場合はC実装のローダーを使用
+_YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    """一時ファイルに書き込んでから置き換えることでファイルを原子的に更新
+
+    書き込み中にプロセスが中断しても、既存のファイルが途中まで書かれた
+    状態で残ることはありません。
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _dump(obj: Any, path: str) -> None:
+    """オブジェクトをJSONファイルに保存
+
+    CheckResultなどのdataclassはそのままJSONオブジェクトとして出力されます。
+    """
+    _atomic_write_bytes(path, orjson.dumps(obj, option=_JSON_OPTIONS))
+
+
+def _load(path: str) -> Any:
+    """JSONファイルを読み込み"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+# 設定ファイルの必須セクション
+_REQUIRED_SECTIONS = ('log_collection', 'ping_targets', 'docker_monitoring', 'storage')
+
+# 設定項目ごとの必須フィールド（キーはエラーメッセージ中の項目名）
+_REQUIRED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'log_collection server': ('name', 'host', 'log_paths'),
+    'ping_targets': ('name', 'host'),
+    'docker_monitoring server': ('host', 'containers'),
+    'default_ssh': ('username', 'key_path'),
+    'web_health_checks target': ('name', 'url'),
+}
+
+# 包含判定用（dictのキービューとの比較はCレベルで行われる）
+_REQUIRED_FIELD_SETS: Dict[str, frozenset] = {
+    kind: frozenset(fields) for kind, fields in _REQUIRED_FIELDS.items()
+}
+
+
+# 設定検証のエラーメッセージ
+_ERR_CONFIG_NOT_MAPPING = "Configuration must be a mapping, got {}".format
+_ERR_MISSING_SECTION = "Missing required section: {}".format
+_ERR_MISSING_FIELDS = "Missing required fields {} in {} configuration".format
+_ERR_MISSING_OUTPUT_FOLDER = "Missing 'output_folder' in storage configuration"
+_ERR_STORAGE_NOT_FOUND = "Storage directory does not exist: {}".format
+_ERR_LOG_PATHS_NOT_LIST = "'log_paths' must be a list for server {}".format
+_ERR_PING_TARGETS_NOT_LIST = "'ping_targets' must be a list"
+_ERR_MISSING_DOCKER_SERVERS = "Missing 'servers' in docker_monitoring configuration"
+_ERR_CONTAINERS_NOT_LIST = "'containers' must be a list for server {}".format
+_ERR_MISSING_CONTAINER_NAME = "Missing 'name' in container configuration for server {}".format
+_ERR_MISSING_HEALTH_CHECK_URL = "Missing 'health_check_url' for web container {}".format
+_ERR_MISSING_WEB_TARGETS = "Missing 'targets' in web_health_checks configuration"
+_ERR_VALIDATION = "Configuration validation error: {}".format
+
+
+def _is_unreachable_error(exc: BaseException) -> bool:
+    """接続失敗が名前解決の失敗またはタイムアウトによるものかを判定
+
+    httpxは元の例外を__cause__/__context__に保持するため、連鎖をたどって確認します。
+    接続拒否はホスト自体には到達できているため対象外です。
+
+    Args:
+        exc: 接続時に発生した例外
+
+    Returns:
+        bool: ホストを到達不可能として扱うべき場合はTrue
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, (socket.gaierror, socket.timeout, TimeoutError,
+                            httpx.TimeoutException)):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _local_log_names(log_paths: List[str]) -> Dict[str, str]:
+    """サーバー上のログパスから保存先のファイル名を決定
+
+    ファイル名が重複しない場合はそのまま使用し、重複する場合はパス全体を
+    ファイル名に含めて区別します（/var/log/a/app.log -> var_log_a_app.log）。
+
+    Args:
+        log_paths: サーバー上のログファイルパスのリスト
+
+    Returns:
+        Dict[str, str]: ログパス -> 保存先のファイル名
+    """
+    basenames = [os.path.basename(path) for path in log_paths]
+    counts: Dict[str, int] = {}
+    for name in basenames:
+        counts[name] = counts.get(name, 0) + 1
+    return {
+        path: name if counts[name] == 1 else path.strip('/').replace('/', '_')
+        for path, name in zip(log_paths, basenames)
+    }
+
+
+def _check_required_fields(item: Dict[str, Any], kind: str) -> Optional[str]:
+    """必須フィールドの存在を確認
+
+    Args:
+        item: 検証する設定項目
+        kind: _REQUIRED_FIELDSのキー
+
+    Returns:
+        エラーメッセージ（不足がある場合）またはNone
+    """
+    # 正常な設定ではリストやメッセージを作成せずに終了
+    if isinstance(item, dict) and item.keys() >= _REQUIRED_FIELD_SETS[kind]:
+        return None
+    missing_fields = [field for field in _REQUIRED_FIELDS[kind] if field not in item]
+    return _ERR_MISSING_FIELDS(missing_fields, kind)
+
+
+class _PingSocket:
+    """1つのICMPソケットで複数ホストへのEcho要求を送受信するヘルパークラス
+
+    rawソケットを作成する権限がない場合は、Linuxの非特権ICMPソケット
+    （SOCK_DGRAM）にフォールバックします。
+
+    Attributes:
+        family: アドレスファミリー（AF_INET/AF_INET6）
+        ident: Echo要求に設定する識別子
+        raw: rawソケットを使用している場合はTrue
+    """
+
+    _ECHO_TYPES = {
+        socket.AF_INET: (8, 0),
+        socket.AF_INET6: (128, 129),
+    }
+
+    def __init__(self, family: int, ident: int):
+        self.family = family
+        self.ident = ident
+        self._request_type, self._reply_type = self._ECHO_TYPES[family]
+        proto = socket.IPPROTO_ICMP if family == socket.AF_INET else socket.IPPROTO_ICMPV6
+        try:
+            self.sock = socket.socket(family, socket.SOCK_RAW, proto)
+            self.raw = True
+        except PermissionError:
+            self.sock = socket.socket(family, socket.SOCK_DGRAM, proto)
+            self.raw = False
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    @staticmethod
+    def _checksum(data: bytes) -> int:
+        """ICMPチェックサム（16ビット1の補数和）を計算"""
+        if len(data) % 2:
+            data += b'\x00'
+        total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+        total = (total >> 16) + (total & 0xFFFF)
+        total += total >> 16
+        return ~total & 0xFFFF
+
+    def send(self, address: Tuple, seq: int) -> None:
+        """Echo要求を送信
+
+        Args:
+            address: getaddrinfoで解決済みの送信先アドレス
+            seq: シーケンス番号
+        """
+        header = struct.pack('!BBHHH', self._request_type, 0, 0, self.ident, seq)
+        payload = b'BeaconBase'
+        # ICMPv6のチェックサムはカーネルが計算する
+        if self.family == socket.AF_INET:
+            checksum = self._checksum(header + payload)
+            header = struct.pack('!BBHHH', self._request_type, 0, checksum, self.ident, seq)
+        self.sock.sendto(header + payload, address)
+
+    def receive(self) -> Optional[Tuple[int, str]]:
+        """Echo応答を1件受信
+
+        Returns:
+            Optional[Tuple[int, str]]: 自身宛てのEcho応答であればシーケンス番号と
+                送信元アドレス、それ以外はNone
+        """
+        data, source = self.sock.recvfrom(2048)
+        # IPv4のrawソケットではIPヘッダーが付与されている
+        if self.raw and self.family == socket.AF_INET:
+            data = data[(data[0] & 0x0F) * 4:]
+        if len(data) < 8:
+            return None
+
+        icmp_type, _, _, ident, seq = struct.unpack('!BBHHH', data[:8])
+        if icmp_type != self._reply_type:
+            return None
+        # 非特権ソケットでは識別子がカーネルにより書き換えられるため照合しない
+        if self.raw and ident != self.ident:
+            return None
+        return seq, source[0]
+
+    def close(self) -> None:
+        self.sock.close()
+
+
 class MonitoringSystem:
     """システム監視の中核クラス
     
@@ -89,12 +351,31 @@ class MonitoringSystem:
         retry_delay: リトライ間隔（秒）
         timeout: 操作タイムアウト（秒）
         max_workers: 並列実行数
+        max_target_workers: カテゴリ内で対象ごとに並列実行する最大数
+        first_poll_event: バックグラウンド監視の初回実行が完了するとセットされるイベント
     """
 
     DEFAULT_RETRY_COUNT = 3
     DEFAULT_RETRY_DELAY = 5
+    MAX_RETRY_DELAY = 60
+    DNS_CACHE_TTL = 300
+    CONFIG_CACHE_FILENAME = '.beaconbase.cache.json'
     DEFAULT_TIMEOUT = 30
     DEFAULT_MAX_WORKERS = 5
+    DEFAULT_MAX_TARGET_WORKERS = 32
+    DEFAULT_PING_TIMEOUT = 5
+    DEFAULT_HTTP_MAX_CONNECTIONS = 64
+    DEFAULT_HTTP_MAX_KEEPALIVE = 32
+    HTTP_DEFAULT_PORTS = {'http': 80, 'https': 443}
+    MAX_SFTP_WORKERS = 8
+    # sshdのMaxSessions（既定10）に余裕を持たせた同時チャネル数
+    MAX_SSH_CHANNELS_PER_HOST = 8
+    SFTP_WINDOW_SIZE = 4 * 1024 * 1024
+    SFTP_MAX_PACKET_SIZE = 32768
+    SSH_KEEPALIVE_INTERVAL = 30
+    LOG_SUMMARY_TAIL_LINES = 50
+    LOG_SUMMARY_TAIL_BYTES = 8192
+    LOG_COUNT_CHUNK_SIZE = 1024 * 1024
 
     def __init__(self, config_path: str):
         """初期化
@@ -105,15 +386,66 @@ class MonitoringSystem:
         Raises:
             MonitoringError: 設定ファイルの読み込みに失敗した場合
         """
+        self._setup_logging()
         try:
-            with open(config_path, 'r', encoding="utf-8") as f:
-                self.config = yaml.safe_load(f)
+            self.config = self._load_config(config_path)
         except Exception as e:
             raise MonitoringError(f"Failed to load config file: {e}")
 
-        self._setup_logging()
         self._initialize_parameters()
         self._validate_and_create_directories()
+        self._setup_http_session()
+
+    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        """設定ファイルを読み込み
+        
+        storage.enable_config_cache が有効な場合、解析済みの設定を設定ファイルと
+        同じディレクトリの CONFIG_CACHE_FILENAME に保存し、パス・更新時刻・内容の
+        ハッシュが一致する間はYAMLの解析を省略します。
+        
+        Args:
+            config_path: YAML形式の設定ファイルパス
+            
+        Returns:
+            Dict[str, Any]: 設定内容
+            
+        Raises:
+            MonitoringError: 設定内容がマッピングでない場合
+        """
+        with open(config_path, 'rb') as f:
+            raw = f.read()
+        cache_key = ":".join((
+            os.path.abspath(config_path),
+            str(os.stat(config_path).st_mtime_ns),
+            hashlib.blake2b(raw, digest_size=16).hexdigest()
+        ))
+        cache_path = os.path.join(
+            os.path.dirname(os.path.abspath(config_path)), self.CONFIG_CACHE_FILENAME
+        )
+
+        try:
+            cached = _load(cache_path)
+            if cached.get('key') == cache_key:
+                return cached['config']
+        except (OSError, orjson.JSONDecodeError, AttributeError, KeyError):
+            pass
+
+        config = yaml.load(raw, Loader=_YamlSafeLoader)
+        # 空のファイルやリストなどは各項目を参照する前に拒否する
+        if not isinstance(config, dict):
+            raise MonitoringError(_ERR_CONFIG_NOT_MAPPING(type(config).__name__))
+
+        storage = config.get('storage')
+        if isinstance(storage, dict) and storage.get('enable_config_cache'):
+            try:
+                payload = orjson.dumps({'key': cache_key, 'config': config})
+                # JSONで往復できない値（日付・文字列以外のキーなど）を含む場合はキャッシュしない
+                if orjson.loads(payload)['config'] == config:
+                    _atomic_write_bytes(cache_path, payload)
+            except (OSError, TypeError) as e:
+                self.logger.warning("Could not write config cache %s: %s", cache_path, e)
+
+        return config
 
     def _initialize_parameters(self):
         """パラメータの初期化"""
@@ -121,16 +453,98 @@ class MonitoringSystem:
         self.retry_delay = self.DEFAULT_RETRY_DELAY
         self.timeout = self.DEFAULT_TIMEOUT
         self.max_workers = self.DEFAULT_MAX_WORKERS
+        self.max_target_workers = self.DEFAULT_MAX_TARGET_WORKERS
+        self.ping_timeout = self.DEFAULT_PING_TIMEOUT
+        # (host, port, username) をキーとするSSH接続プール
+        self._ssh_pool: Dict[Tuple[str, int, str], paramiko.SSHClient] = {}
+        self._ssh_locks: Dict[Tuple[str, int, str], threading.Lock] = {}
+        self._ssh_channel_limits: Dict[Tuple[str, int, str], threading.BoundedSemaphore] = {}
+        self._ssh_pool_lock = threading.Lock()
+        # 到達できなかった (プロトコル, ホスト, ポート) -> 再試行を控える期限（time.monotonic）
+        self._down_until: Dict[Tuple[str, str, int], float] = {}
+        # Ping用の名前解決結果 -> (有効期限, getaddrinfoの結果)
+        self._dns_cache: Dict[str, Tuple[float, Tuple]] = {}
+        # カテゴリごとの監視結果ファイル（追記用に開いたまま保持）
+        self._result_files: Dict[str, io.BufferedWriter] = {}
+        self._log_summary_file: Optional[io.BufferedWriter] = None
+        # summary/index.json の内容（カテゴリ -> ハッシュと更新時刻）
+        self._summary_index: Optional[Dict[str, Dict[str, str]]] = None
+        # 作成済み（存在確認済み）の出力ディレクトリ
+        self._mkdirs_done: Set[str] = set()
+        # run_all_checks実行中の共通タイムスタンプ
+        self._wave_time: Optional[datetime] = None
+        self._wave_ts: Optional[str] = None
+        self._wave_lock = threading.Lock()
+
+        # バックグラウンド監視の状態
+        self._stop_event = threading.Event()
+        self._cache_lock = threading.RLock()
+        self._cached: Optional[Dict[str, List[CheckResult]]] = None
+        self._poll_thread: Optional[threading.Thread] = None
+        self.first_poll_event = threading.Event()
+
+        # SSH接続先ごとの解決済み設定
+        # id(サーバー設定) -> (サーバー設定, 接続設定)
+        self._host_specs: Dict[int, Tuple[Dict[str, Any], _HostSpec]] = {}
+        for section in ('log_collection', 'docker_monitoring'):
+            section_config = self.config.get(section)
+            servers = section_config.get('servers') if isinstance(section_config, dict) else None
+            if not isinstance(servers, list):
+                continue
+            for server in servers:
+                if isinstance(server, dict) and 'host' in server:
+                    self._host_specs[id(server)] = (server, self._build_host_spec(server))
+
+        # サマリー作成用のPing対象の索引
+        ping_targets = self.config.get('ping_targets')
+        if not isinstance(ping_targets, list):
+            ping_targets = []
+        ping_targets = [target for target in ping_targets if isinstance(target, dict)]
+        self._ping_target_by_name: Dict[str, Dict[str, Any]] = {
+            target.get('name'): target for target in ping_targets
+        }
+        self._ping_target_by_host: Dict[str, Dict[str, Any]] = {
+            target.get('host'): target for target in ping_targets
+        }
 
     def _validate_and_create_directories(self):
         """出力ディレクトリの検証と作成"""
         try:
             output_dir = self.config['storage']['output_folder']
-            os.makedirs(output_dir, exist_ok=True)
-            os.makedirs(os.path.join(output_dir, 'logs'), exist_ok=True)
+            self._ensure_dir(output_dir)
+            self._ensure_dir(os.path.join(output_dir, 'logs'))
         except Exception as e:
             raise MonitoringError(f"Failed to create output directories: {e}")
 
+    def _ensure_dir(self, path: str) -> None:
+        """ディレクトリを作成（このプロセスで作成済みの場合は何もしない）"""
+        if path not in self._mkdirs_done:
+            os.makedirs(path, exist_ok=True)
+            self._mkdirs_done.add(path)
+
+    def _write_in_dir(self, path: str, write: Callable[..., Any], *args, **kwargs) -> Any:
+        """ディレクトリ内への書き込みを実行
+        
+        実行中にディレクトリが削除されていた場合（FileNotFoundError）は、
+        作成済みの記録を破棄してディレクトリを作り直し、1度だけ再試行します。
+        
+        Args:
+            path: 書き込み先のディレクトリ
+            write: 書き込みを行う関数
+            *args: writeに渡す位置引数
+            **kwargs: writeに渡すキーワード引数
+            
+        Returns:
+            Any: writeの戻り値
+        """
+        self._ensure_dir(path)
+        try:
+            return write(*args, **kwargs)
+        except FileNotFoundError:
+            self._mkdirs_done.discard(path)
+            self._ensure_dir(path)
+            return write(*args, **kwargs)
+
     def _setup_logging(self):
         """ロギングの設定"""
         logging.basicConfig(
@@ -139,6 +553,76 @@ class MonitoringSystem:
         )
         self.logger = logging.getLogger('BeaconBase')
 
+    def _setup_http_session(self):
+        """HTTPクライアントの設定
+        
+        すべてのHTTPヘルスチェックでHTTP/2対応のクライアントを共有し、
+        同一オリジンへのリクエストを1つのTCP/TLS接続に多重化します。
+        """
+        # (証明書検証の有無, 最大接続数, オリジン) をキーとするクライアント
+        self._http_clients: Dict[
+            Tuple[bool, int, Optional[Tuple[str, str, int]]], httpx.Client
+        ] = {}
+        self._http_lock = threading.Lock()
+
+    def _get_http_client(self, verify: bool = True,
+                         max_connections: Optional[int] = None,
+                         url: Optional[str] = None) -> httpx.Client:
+        """共有HTTPクライアントを取得
+        
+        httpxでは証明書検証の設定がクライアント単位のため、
+        検証の有無と最大接続数の組み合わせごとにクライアントを作成します。
+        httpxの接続数の上限はクライアント全体に対するものであるため、
+        最大接続数を指定した場合はオリジンごとに別のクライアントを使用し、
+        オリジン単位の上限とします。
+        
+        Args:
+            verify: SSL証明書を検証する場合はTrue
+            max_connections: オリジンごとの最大接続数
+                （省略時は全オリジン共通でDEFAULT_HTTP_MAX_CONNECTIONS）
+            url: リクエスト先のURL（max_connectionsを指定する場合に使用）
+            
+        Returns:
+            httpx.Client: HTTPクライアント
+            
+        Raises:
+            httpx.InvalidURL: URLが不正な場合
+        """
+        origin = self._url_origin(url) if max_connections and url else None
+        max_connections = max_connections or self.DEFAULT_HTTP_MAX_CONNECTIONS
+        key = (bool(verify), max_connections, origin)
+        with self._http_lock:
+            client = self._http_clients.get(key)
+            if client is None:
+                client = httpx.Client(
+                    http2=True,
+                    verify=verify,
+                    follow_redirects=True,
+                    timeout=httpx.Timeout(self.timeout),
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=min(max_connections, self.DEFAULT_HTTP_MAX_KEEPALIVE)
+                    )
+                )
+                self._http_clients[key] = client
+            return client
+
+    def _url_origin(self, url: str) -> Tuple[str, str, int]:
+        """URLのオリジン（スキーム, ホスト, ポート）を取得
+        
+        Args:
+            url: 対象のURL
+            
+        Returns:
+            Tuple[str, str, int]: オリジン（ポート省略時はスキームの既定ポート）
+        """
+        parsed = httpx.URL(url)
+        return (
+            parsed.scheme,
+            parsed.host,
+            parsed.port or self.HTTP_DEFAULT_PORTS.get(parsed.scheme, 0)
+        )
+
     def retry_operation(self, operation, *args, **kwargs) -> Any:
         """操作のリトライ処理
         
@@ -153,19 +637,43 @@ class MonitoringSystem:
         Raises:
             RetryableError: すべてのリトライが失敗した場合
         """
-        last_error = None
-        for attempt in range(self.retry_count):
+        attempts = max(1, self.retry_count)
+        for attempt in range(attempts):
             try:
                 return operation(*args, **kwargs)
             except RetryableError as e:
-                last_error = e
                 self.logger.warning(
-                    f"Retry attempt {attempt + 1} of {self.retry_count} failed: {e}"
+                    "Retry attempt %d of %d failed: %s", attempt + 1, attempts, e
                 )
-                if attempt < self.retry_count - 1:
-                    time.sleep(self.retry_delay)
-                continue
-        raise last_error
+                if attempt == attempts - 1:
+                    raise
+                # 指数バックオフ＋ジッタで待機（停止要求があれば即座に中断）
+                delay = min(
+                    self.retry_delay * (2 ** attempt) * (0.5 + random.random()),
+                    self.MAX_RETRY_DELAY
+                )
+                if self._stop_event.wait(delay):
+                    raise
+
+    def _run_concurrently(self, func, items: List[Any]) -> List[Any]:
+        """各要素に対して関数を並列実行
+        
+        ネットワークI/O待ちの対象が直列化しないよう、対象ごとにスレッドへ
+        振り分けます。
+        
+        Args:
+            func: 各要素に適用する関数
+            items: 処理対象のリスト
+            
+        Returns:
+            List[Any]: 入力と同じ順序の実行結果
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        workers = min(self.max_target_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
 
     def run_all_checks(self) -> Dict[str, List[CheckResult]]:
         """全ての監視チェックを並列実行
@@ -176,47 +684,139 @@ class MonitoringSystem:
         Raises:
             MonitoringError: 監視チェックの実行に失敗した場合
         """
-        try:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                check_functions = {
-                    'logs': self.collect_logs,
-                    'ping': self.check_ping,
-                    'docker': self.check_docker_containers,
-                    'web_health': self.check_web_health
-                }
+        # バックグラウンド監視と同時に呼ばれた場合も実行が重ならないようにする
+        with self._wave_lock:
+            # 同じ実行で得られた結果には共通のタイムスタンプを設定
+            self._wave_time = datetime.now()
+            self._wave_ts = self._wave_time.isoformat()
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    check_functions = {
+                        'logs': self.collect_logs,
+                        'ping': self.check_ping,
+                        'docker': self.check_docker_containers,
+                        'web_health': self.check_web_health
+                    }
                 
-                future_to_check = {
-                    executor.submit(func): check_type
-                    for check_type, func in check_functions.items()
-                }
+                    future_to_check = {
+                        executor.submit(func): check_type
+                        for check_type, func in check_functions.items()
+                    }
 
-                results = {}
-                for future in as_completed(future_to_check):
-                    check_type = future_to_check[future]
-                    try:
-                        data = future.result(timeout=self.timeout)
-                        self._save_results(data, check_type)
-                        results[check_type] = data
-                    except Exception as e:
-                        error_msg = f"Error in {check_type} check: {e}"
-                        self.logger.error(error_msg)
-                        results[check_type] = [
-                            CheckResult(
-                                name=check_type,
-                                status=CheckStatus.ERROR,
-                                timestamp=datetime.now().isoformat(),
-                                details={'error': str(e)}
-                            )
-                        ]
-
-            # 監視結果のサマリーを出力
-            self._write_check_summary(results)
-            # エラーのみのサマリーを出力
-            self._write_error_summary(results)
-            return results
+                    results = {}
+                    for future in as_completed(future_to_check):
+                        check_type = future_to_check[future]
+                        try:
+                            data = future.result(timeout=self.timeout)
+                            self._save_results(data, check_type)
+                            results[check_type] = data
+                        except Exception as e:
+                            error_msg = f"Error in {check_type} check: {e}"
+                            self.logger.error(error_msg)
+                            results[check_type] = [
+                                self._mk_result(
+                                    name=check_type,
+                                    status=CheckStatus.ERROR,
+                                    details={'error': str(e)}
+                                )
+                            ]
+
+                # 監視結果のサマリーを出力
+                self._write_check_summary(results)
+                # エラーのみのサマリーを出力
+                self._write_error_summary(results)
+                return results
 
-        except Exception as e:
-            raise MonitoringError(f"Error during monitoring checks: {e}")
+            except Exception as e:
+                raise MonitoringError(f"Error during monitoring checks: {e}")
+            finally:
+                self._wave_time = None
+                self._wave_ts = None
+
+    def start_background(self, interval: float = 60) -> None:
+        """バックグラウンドでの定期監視を開始
+        
+        デーモンスレッドで run_all_checks を interval 秒ごとに実行し、
+        最新の結果をキャッシュします。呼び出し側は get_cached_results で
+        待ち時間なしに結果を参照できます。初回の結果を待つ場合は
+        first_poll_event.wait(timeout) を使用します。
+        
+        Args:
+            interval: 監視の実行間隔（秒）
+            
+        Raises:
+            MonitoringError: バックグラウンド監視が既に実行中の場合
+        """
+        if self._poll_thread is not None and self._poll_thread.is_alive():
+            raise MonitoringError("Background monitoring is already running")
+
+        self._stop_event.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop,
+            args=(interval,),
+            name='BeaconBase-poller',
+            daemon=True
+        )
+        self._poll_thread.start()
+
+    def _poll_loop(self, interval: float) -> None:
+        """バックグラウンド監視のループ"""
+        while not self._stop_event.is_set():
+            try:
+                results = self.run_all_checks()
+                with self._cache_lock:
+                    self._cached = results
+            except Exception as e:
+                self.logger.error("Background monitoring failed: %s", e)
+            finally:
+                # 初回が失敗しても待機中の呼び出し側をブロックし続けない
+                self.first_poll_event.set()
+            self._stop_event.wait(interval)
+
+    def get_cached_results(self) -> Optional[Dict[str, List[CheckResult]]]:
+        """バックグラウンド監視の最新結果を取得
+        
+        Returns:
+            Optional[Dict[str, List[CheckResult]]]: カテゴリごとのチェック結果、
+                まだ結果がない場合はNone
+        """
+        with self._cache_lock:
+            return self._cached
+
+    def stop_background(self) -> None:
+        """バックグラウンド監視を停止
+        
+        実行中の監視が完了するまで待機します。停止後はフォアグラウンドでの
+        run_all_checks や retry_operation が通常どおりリトライできるよう、
+        停止要求を解除します。
+        """
+        self._stop_event.set()
+        if self._poll_thread is not None:
+            self._poll_thread.join()
+            self._poll_thread = None
+        self._stop_event.clear()
+
+    def _now(self) -> datetime:
+        """現在時刻を取得（run_all_checksの実行中はその開始時刻）"""
+        return self._wave_time or datetime.now()
+
+    def _mk_result(self, name: str, status: CheckStatus, details: Dict[str, Any],
+                   timestamp: Optional[str] = None) -> CheckResult:
+        """チェック結果を作成
+        
+        Args:
+            name: チェック対象の名前
+            status: チェックの状態
+            details: 詳細情報を含む辞書
+            timestamp: チェック実行時刻。省略時はrun_all_checksの開始時刻
+                （単独で呼ばれた場合は現在時刻）
+            
+        Returns:
+            CheckResult: チェック結果
+        """
+        if timestamp is None:
+            timestamp = self._wave_ts or datetime.now().isoformat()
+        return CheckResult(name=name, status=status, timestamp=timestamp, details=details)
 
     def collect_logs(self) -> List[CheckResult]:
         """すべての対象サーバーからログを収集
@@ -228,23 +828,33 @@ class MonitoringSystem:
             List[CheckResult]: 収集したログファイルの情報
         """
         results = []
-        for server in self.config['log_collection']['servers']:
-            try:
-                logs = self.retry_operation(self._collect_server_logs, server)
-                results.extend(logs)
-            except Exception as e:
-                self.logger.error(f"Failed to collect logs from {server['name']}: {e}")
-                results.append(CheckResult(
-                    name=server['name'],
-                    status=CheckStatus.ERROR,
-                    timestamp=datetime.now().isoformat(),
-                    details={'error': str(e)}
-                ))
+        servers = self.config['log_collection']['servers']
+        for logs in self._run_concurrently(self._collect_logs_from, servers):
+            results.extend(logs)
         
         return results
 
-    def _get_ssh_config(self, server: Dict[str, Any]) -> Dict[str, str]:
-        """サーバーのSSH設定を取得
+    def _collect_logs_from(self, server: Dict[str, Any]) -> List[CheckResult]:
+        """リトライ付きで個別サーバーからログを収集
+        
+        Args:
+            server: サーバー設定を含むdict
+            
+        Returns:
+            List[CheckResult]: 収集したログファイルの情報
+        """
+        try:
+            return self.retry_operation(self._collect_server_logs, server)
+        except Exception as e:
+            self.logger.error("Failed to collect logs from %s: %s", server['name'], e)
+            return [self._mk_result(
+                name=server['name'],
+                status=CheckStatus.ERROR,
+                details={'error': str(e)}
+            )]
+
+    def _build_host_spec(self, server: Dict[str, Any]) -> _HostSpec:
+        """サーバー設定からSSH接続設定を作成
         
         サーバー固有のSSH設定がない場合は、デフォルト設定を使用します。
         
@@ -252,14 +862,187 @@ class MonitoringSystem:
             server: サーバー設定を含むdict
         
         Returns:
-            SSH接続に必要なusernameとkey_pathを含むdict
+            _HostSpec: SSH接続設定
         """
-        default_ssh = self.config.get('default_ssh', {})
-        return {
-            'username': server.get('ssh_username', default_ssh.get('username')),
-            'key_path': server.get('ssh_key_path', default_ssh.get('key_path')),
-            'port': server.get('ssh_port', default_ssh.get('key_path'))
-        }
+        # 初期化時（設定の検証前）にも呼ばれるため、不正な形式は未設定として扱う
+        default_ssh = self.config.get('default_ssh')
+        if not isinstance(default_ssh, dict):
+            default_ssh = {}
+        return _HostSpec(
+            host=server['host'],
+            port=server.get('ssh_port', default_ssh.get('port', 22)),
+            username=server.get('ssh_username', default_ssh.get('username')),
+            key_path=server.get('ssh_key_path', default_ssh.get('key_path'))
+        )
+
+    def _get_ssh_config(self, server: Dict[str, Any]) -> _HostSpec:
+        """サーバーのSSH接続設定を取得
+        
+        設定ファイルに記載されたサーバーは初期化時に解決済みの設定を返します。
+        
+        Args:
+            server: サーバー設定を含むdict
+        
+        Returns:
+            _HostSpec: SSH接続設定
+        """
+        cached = self._host_specs.get(id(server))
+        if cached is not None and cached[0] is server:
+            return cached[1]
+        return self._build_host_spec(server)
+
+    def _ssh_key(self, server: Dict[str, Any]) -> Tuple[str, int, str]:
+        """SSH接続プールのキーを取得"""
+        return self._get_ssh_config(server).key
+
+    def _get_ssh(self, server: Dict[str, Any]) -> paramiko.SSHClient:
+        """サーバーへのSSH接続をプールから取得
+        
+        同じホスト・ポート・ユーザーへの接続は、ログ収集とDockerコンテナ監視で
+        共有されます。未接続の場合はこの時点で接続します。
+        
+        Args:
+            server: サーバー設定を含むdict
+            
+        Returns:
+            paramiko.SSHClient: 接続済みのSSHクライアント
+            
+        Raises:
+            RetryableError: SSH設定が不足している場合
+        """
+        ssh_config = self._get_ssh_config(server)
+        if not ssh_config.username or not ssh_config.key_path:
+            raise RetryableError(
+                f"Missing SSH configuration for server {server.get('name', server['host'])}"
+            )
+
+        key = ssh_config.key
+        with self._ssh_pool_lock:
+            lock = self._ssh_locks.setdefault(key, threading.Lock())
+
+        # テキストログは圧縮効果が高いため既定で圧縮を有効にする
+        # （圧縮済みログのみを扱う場合は log_collection.compress: false）
+        compress = (self.config.get('log_collection') or {}).get('compress', True)
+
+        # 同一ホストへの接続処理のみを直列化する
+        with lock:
+            ssh = self._ssh_pool.get(key)
+            if ssh is not None:
+                transport = ssh.get_transport()
+                if transport is None or not transport.is_active():
+                    # 切断済みの接続は破棄して再接続する
+                    with self._ssh_pool_lock:
+                        self._ssh_pool.pop(key, None)
+                    ssh.close()
+                    ssh = None
+            if ssh is None:
+                down_key = ('ssh', ssh_config.host, ssh_config.port)
+                if self._is_host_down(down_key):
+                    raise MonitoringError(
+                        f"Host {ssh_config.host}:{ssh_config.port} was recently unreachable; "
+                        "connection skipped"
+                    )
+                ssh = paramiko.SSHClient()
+                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+                try:
+                    ssh.connect(
+                        ssh_config.host,
+                        username=ssh_config.username,
+                        key_filename=ssh_config.key_path,
+                        port=ssh_config.port,
+                        compress=compress,
+                        banner_timeout=10,
+                        auth_timeout=10
+                    )
+                except OSError as e:
+                    ssh.close()
+                    # 接続拒否は即座に返るため、名前解決の失敗とタイムアウトのみ記録
+                    if _is_unreachable_error(e):
+                        self._mark_host_down(down_key)
+                    raise
+                self._mark_host_up(down_key)
+                # SFTP転送で多くのデータを送受信できるようウィンドウを拡大
+                transport = ssh.get_transport()
+                transport.default_window_size = self.SFTP_WINDOW_SIZE
+                transport.default_max_packet_size = self.SFTP_MAX_PACKET_SIZE
+                # 監視間隔の間にNAT・ファイアウォールで切断されないよう維持
+                transport.set_keepalive(self.SSH_KEEPALIVE_INTERVAL)
+                self._ssh_pool[key] = ssh
+            return ssh
+
+    def _ssh_channel_limit(self, server: Dict[str, Any]) -> threading.BoundedSemaphore:
+        """SSH接続ごとの同時チャネル数を制限するセマフォを取得
+        
+        同じホストに対するログ収集とDockerコンテナ監視が並列に実行されても、
+        1つの接続上で開くチャネルが MAX_SSH_CHANNELS_PER_HOST を超えないようにします。
+        
+        Args:
+            server: サーバー設定を含むdict
+            
+        Returns:
+            threading.BoundedSemaphore: 接続ごとのセマフォ
+        """
+        key = self._ssh_key(server)
+        with self._ssh_pool_lock:
+            limit = self._ssh_channel_limits.get(key)
+            if limit is None:
+                limit = self._ssh_channel_limits[key] = threading.BoundedSemaphore(
+                    self.MAX_SSH_CHANNELS_PER_HOST
+                )
+            return limit
+
+    def _is_host_down(self, key: Tuple[str, str, int]) -> bool:
+        """接続先が直前に到達不可能だったかを確認
+        
+        Args:
+            key: (プロトコル, ホスト, ポート)
+        """
+        return time.monotonic() < self._down_until.get(key, 0)
+
+    def _mark_host_down(self, key: Tuple[str, str, int]) -> None:
+        """接続先を一定時間（retry_delayの2倍）到達不可能として記録
+        
+        同じ接続先への他のチェックが接続タイムアウトを繰り返し待たないよう、
+        期間中の接続は即座にエラーとします。
+        
+        Args:
+            key: (プロトコル, ホスト, ポート)
+        """
+        self._down_until[key] = time.monotonic() + self.retry_delay * 2
+
+    def _mark_host_up(self, key: Tuple[str, str, int]) -> None:
+        """接続先の到達不可能の記録を解除
+        
+        Args:
+            key: (プロトコル, ホスト, ポート)
+        """
+        self._down_until.pop(key, None)
+
+    def _discard_ssh(self, server: Dict[str, Any]) -> None:
+        """切断されたSSH接続をプールから破棄
+        
+        他のチェックが同じ接続を使用している可能性があるため、
+        トランスポートが有効な接続は破棄しません。
+        """
+        key = self._ssh_key(server)
+        with self._ssh_pool_lock:
+            ssh = self._ssh_pool.get(key)
+            if ssh is None:
+                return
+            transport = ssh.get_transport()
+            if transport is not None and transport.is_active():
+                return
+            ssh = self._ssh_pool.pop(key, None)
+        if ssh is not None:
+            ssh.close()
+
+    def close_all_ssh(self) -> None:
+        """プール内のすべてのSSH接続を切断"""
+        with self._ssh_pool_lock:
+            clients = list(self._ssh_pool.values())
+            self._ssh_pool.clear()
+        for ssh in clients:
+            ssh.close()
 
     def _collect_server_logs(self, server: Dict[str, Any]) -> List[CheckResult]:
         """個別サーバーからのログ収集
@@ -270,100 +1053,159 @@ class MonitoringSystem:
         Returns:
             List[CheckResult]: 収集したログファイルの情報
         """
-        collected_logs = []
-        missing_logs = []
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        
         try:
-            ssh_config = self._get_ssh_config(server)
-            if not ssh_config['username'] or not ssh_config['key_path']:
-                raise RetryableError(f"Missing SSH configuration for server {server['name']}")
-            
-            ssh.connect(
-                server['host'],
-                username=ssh_config['username'],
-                key_filename=ssh_config['key_path'],
-                port=ssh_config['port'],
+            log_paths = server['log_paths']
+            log_dir = os.path.join(
+                self.config['storage']['output_folder'], 'logs', server['name']
             )
-            
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            sftp = ssh.open_sftp()
-            
-            try:
-                for log_path in server['log_paths']:
-                    local_filename = f"{os.path.basename(log_path)}"
-                    local_path = os.path.join(
-                        self.config['storage']['output_folder'],
-                        'logs',
-                        server['name'],
-                        local_filename
-                    )
-                    
-                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
-                    
+            self._ensure_dir(log_dir)
+            local_names = _local_log_names(log_paths)
+            workers = min(self.MAX_SFTP_WORKERS, len(log_paths))
+
+            # SFTPClientはスレッドセーフではなく、同じ接続を使う他サーバーの収集も
+            # 並行して実行されるため、転送ごとに同じSSH接続上で個別のSFTPチャネルを開く。
+            # チャネル数の枠は転送中のみ確保するため、同じ接続を共有する複数の収集処理が
+            # 並行しても互いに枠を待ち続けることはない
+            ssh = self._get_ssh(server)
+            limit = self._ssh_channel_limit(server)
+
+            def fetch(log_path):
+                with limit:
+                    sftp = ssh.open_sftp()
                     try:
-                        # ファイルの存在確認
-                        sftp.stat(log_path)
-                        
-                        # ファイルが存在する場合のみ取得を実行
-                        sftp.get(log_path, local_path)
-                        
-                        # 設定に基づいてログ削除を実行
-                        delete_after_collection = self.config['log_collection'].get('delete_after_collection', False)
-                        if delete_after_collection:
-                            sftp.remove(log_path)
-                            delete_status = 'deleted'
-                        else:
-                            delete_status = 'preserved'
-                        
-                        collected_logs.append(CheckResult(
-                            name=f"{server['name']}_{os.path.basename(log_path)}",
-                            status=CheckStatus.OK,
-                            timestamp=datetime.now().isoformat(),
-                            details={
-                                'server': server['name'],
-                                'source_path': log_path,
-                                'local_path': local_path,
-                                'status': 'collected',
-                                'server_file_status': delete_status
-                            }
-                        ))
-                        
-                    except FileNotFoundError:
-                        missing_logs.append(CheckResult(
-                            name=f"{server['name']}_{os.path.basename(log_path)}",
-                            status=CheckStatus.NOT_FOUND,
-                            timestamp=datetime.now().isoformat(),
-                            details={
-                                'server': server['name'],
-                                'source_path': log_path,
-                                'status': 'not_found',
-                                'message': 'File not found on server'
-                            }
-                        ))
-                        self.logger.warning(f"Log file not found on server: {log_path}")
-                
-                return collected_logs + missing_logs
-                
-            finally:
-                sftp.close()
+                        return self._fetch_log(
+                            server, sftp, log_path,
+                            os.path.join(log_dir, local_names[log_path])
+                        )
+                    finally:
+                        sftp.close()
+
+            if workers <= 1:
+                results = [fetch(log_path) for log_path in log_paths]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(fetch, log_paths))
+
+            ok = CheckStatus.OK
+            collected_logs = [r for r in results if r.status is ok]
+            missing_logs = [r for r in results if r.status is not ok]
+            return collected_logs + missing_logs
                 
         except Exception as e:
+            self._discard_ssh(server)
             error_message = f"Failed to collect logs from {server['name']}: {e}"
             self.logger.error(error_message)
-            return [CheckResult(
+            return [self._mk_result(
                 name=server['name'],
                 status=CheckStatus.ERROR,
-                timestamp=datetime.now().isoformat(),
                 details={
                     'server': server['name'],
                     'status': 'error',
                     'message': error_message
                 }
             )]
-        finally:
-            ssh.close()
+
+    def _fetch_log(self, server: Dict[str, Any], sftp: paramiko.SFTPClient,
+                   log_path: str, local_path: str) -> CheckResult:
+        """個別のログファイルを取得
+        
+        転送ごとに固有の一時ファイルにダウンロードしてから置き換えるため、
+        取得に失敗しても前回収集したファイルは残ります。
+        
+        Args:
+            server: サーバー設定を含むdict
+            sftp: 使用するSFTPクライアント
+            log_path: サーバー上のログファイルパス
+            local_path: 保存先のファイルパス（ディレクトリは作成済み）
+            
+        Returns:
+            CheckResult: ログファイルの収集結果
+        """
+        log_dir, local_name = os.path.split(local_path)
+        fd, partial_path = self._write_in_dir(
+            log_dir, tempfile.mkstemp, dir=log_dir, prefix=f".{local_name}.", suffix='.part'
+        )
+        failure = None
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # 存在確認は行わず、取得時のエラーで判定する。
+                # ローカル側のI/Oエラーは分類せず、サーバー単位のエラーとする
+                try:
+                    sftp.getfo(log_path, f, prefetch=True)
+                except IOError as e:
+                    failure = self._sftp_failure_result(server, log_path, e)
+                    if failure is None:
+                        raise
+            if failure is None:
+                os.replace(partial_path, local_path)
+        except BaseException:
+            os.remove(partial_path)
+            raise
+        if failure is not None:
+            # 前回収集したファイルは残す
+            os.remove(partial_path)
+            return failure
+        
+        # 設定に基づいてログ削除を実行
+        delete_after_collection = self.config['log_collection'].get('delete_after_collection', False)
+        if delete_after_collection:
+            sftp.remove(log_path)
+            delete_status = 'deleted'
+        else:
+            delete_status = 'preserved'
+        
+        return self._mk_result(
+            name=f"{server['name']}_{os.path.basename(log_path)}",
+            status=CheckStatus.OK,
+            details={
+                'server': server['name'],
+                'source_path': log_path,
+                'local_path': local_path,
+                'status': 'collected',
+                'server_file_status': delete_status
+            }
+        )
+
+    def _sftp_failure_result(self, server: Dict[str, Any], log_path: str,
+                             error: IOError) -> Optional[CheckResult]:
+        """SFTPでの取得エラーをファイル単位の結果に変換
+        
+        Args:
+            server: サーバー設定を含むdict
+            log_path: サーバー上のログファイルパス
+            error: sftp.getfoで発生した例外
+            
+        Returns:
+            Optional[CheckResult]: ファイル単位で扱うエラーの結果、
+            それ以外（サーバー単位のエラーとする）はNone
+        """
+        # サーバーによってはFileNotFoundErrorではなくerrno付きのIOErrorになる
+        error_no = getattr(error, 'errno', None)
+        if isinstance(error, FileNotFoundError) or error_no == errno.ENOENT:
+            self.logger.warning("Log file not found on server: %s", log_path)
+            return self._mk_result(
+                name=f"{server['name']}_{os.path.basename(log_path)}",
+                status=CheckStatus.NOT_FOUND,
+                details={
+                    'server': server['name'],
+                    'source_path': log_path,
+                    'status': 'not_found',
+                    'message': 'File not found on server'
+                }
+            )
+        if isinstance(error, PermissionError) or error_no in (errno.EACCES, errno.EPERM):
+            self.logger.error("Permission denied while collecting log file: %s", log_path)
+            return self._mk_result(
+                name=f"{server['name']}_{os.path.basename(log_path)}",
+                status=CheckStatus.ERROR,
+                details={
+                    'server': server['name'],
+                    'source_path': log_path,
+                    'status': 'error',
+                    'message': f"Failed to collect file: {error}"
+                }
+            )
+        return None
 
     def check_ping(self) -> List[CheckResult]:
         """Ping疎通確認を実行
@@ -371,9 +1213,12 @@ class MonitoringSystem:
         Returns:
             List[CheckResult]: 各ターゲットのPing結果
         """
+        targets = self.config['ping_targets']
+        response_times = self._ping_hosts([target['host'] for target in targets])
+
         results = []
-        for target in self.config['ping_targets']:
-            response_time = self._ping_host(target['host'])
+        for target in targets:
+            response_time = response_times.get(target['host'])
             
             if response_time is not None:
                 status = CheckStatus.OK
@@ -382,41 +1227,145 @@ class MonitoringSystem:
                 status = CheckStatus.ERROR
                 details = {'error': 'Host unreachable'}
             
-            results.append(CheckResult(
+            results.append(self._mk_result(
                 name=target['name'],
                 status=status,
-                timestamp=datetime.now().isoformat(),
                 details=details
             ))
         return results
 
-    def _ping_host(self, host: str) -> Optional[float]:
-        """個別のホストにPing実行
+    def _ping_hosts(self, hosts: List[str]) -> Dict[str, Optional[float]]:
+        """複数ホストへPingを一括実行
         
-        ping3ライブラリを使用してPingを実行します。
+        アドレスファミリーごとに1つのICMPソケットを開いて全ホストへEcho要求を
+        まとめて送信し、共通のタイムアウトまで応答を待ち受けます。
         
         Args:
-            host: 対象ホストのIPアドレスまたはホスト名
+            hosts: 対象ホストのIPアドレスまたはホスト名のリスト
             
         Returns:
-            Optional[float]: 応答時間（秒）、到達不可能な場合はNone
+            Dict[str, Optional[float]]: ホストごとの応答時間（秒）、到達不可能な場合はNone
         """
+        response_times: Dict[str, Optional[float]] = {host: None for host in hosts}
+        ident = os.getpid() & 0xFFFF
+        sockets: Dict[int, _PingSocket] = {}
+        # (アドレスファミリー, シーケンス番号) -> (ホスト, 送信先アドレス, 送信時刻)
+        pending: Dict[Tuple[int, int], Tuple[str, str, float]] = {}
+        # ICMPソケットを作成できなかったホスト
+        fallback: List[str] = []
+
         try:
-            # タイムアウトを5秒に設定してping実行
-            result = ping3.ping(host, timeout=5)
+            for seq, host in enumerate(response_times):
+                seq &= 0xFFFF
+                try:
+                    family, address = self._resolve(host)
+                    if family not in sockets:
+                        sockets[family] = _PingSocket(family, ident)
+                    sent_at = time.perf_counter()
+                    sockets[family].send(address, seq)
+                    pending[(family, seq)] = (host, address[0], sent_at)
+                except PermissionError:
+                    fallback.append(host)
+                except OSError as e:
+                    self.logger.error("Unexpected error during ping to %s: %s", host, e)
+
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            deadline = time.monotonic() + self.ping_timeout
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                readable, _, _ = select.select(list(sockets.values()), [], [], remaining)
+                for ping_socket in readable:
+                    reply = ping_socket.receive()
+                    received_at = time.perf_counter()
+                    if reply is None:
+                        continue
+                    seq, source = reply
+                    key = (ping_socket.family, seq)
+                    entry = pending.get(key)
+                    # 同じプロセス内の他のPing（同じ識別子・シーケンス番号）への応答を
+                    # 取り違えないよう、送信先からの応答であることを確認する
+                    if entry is not None and entry[1] == source:
+                        del pending[key]
+                        host, _, sent_at = entry
+                        response_times[host] = received_at - sent_at
+                        if debug:
+                            self.logger.debug("Ping result for %s: %s", host, response_times[host])
+        finally:
+            for ping_socket in sockets.values():
+                ping_socket.close()
 
-            # デバッグ用にping結果を記録
-            self.logger.debug(f"Ping result for {host}: {result}")
+        if fallback:
+            response_times.update(self._fping_hosts(fallback))
 
-            # ping3は到達可能な場合は応答時間（float）を返し、
-            # 到達不可能な場合はNoneまたはFalseを返す
-            if result is not None and result is not False:
-                return float(result)
-            return None
+        return response_times
 
-        except Exception as e:
-            self.logger.error(f"Unexpected error during ping to {host}: {str(e)}")
-            return None
+    def _fping_hosts(self, hosts: List[str]) -> Dict[str, Optional[float]]:
+        """fpingコマンドで複数ホストへPingを一括実行
+        
+        rawソケット・非特権ICMPソケットのどちらも作成する権限がない環境向けの
+        フォールバックです。fpingがインストールされていない場合は全ホストを
+        到達不可能として扱います。
+        
+        Args:
+            hosts: 対象ホストのIPアドレスまたはホスト名のリスト
+            
+        Returns:
+            Dict[str, Optional[float]]: ホストごとの応答時間（秒）、到達不可能な場合はNone
+        """
+        response_times: Dict[str, Optional[float]] = {host: None for host in hosts}
+        fping = shutil.which('fping')
+        if fping is None:
+            self.logger.error("Cannot open ICMP socket and fping is not installed")
+            return response_times
+
+        try:
+            completed = subprocess.run(
+                [fping, '-C', '1', '-q', '-r', '0',
+                 '-t', str(int(self.ping_timeout * 1000)), *response_times],
+                capture_output=True,
+                text=True,
+                timeout=self.ping_timeout + 5
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.error("Unexpected error during fping: %s", e)
+            return response_times
+
+        # 出力形式: "<ホスト> : <応答時間(ms)>"（到達不可能な場合は "-"）
+        for line in completed.stderr.splitlines():
+            host, sep, value = line.partition(' : ')
+            host = host.strip()
+            if not sep or host not in response_times:
+                continue
+            try:
+                response_times[host] = float(value.split()[0]) / 1000
+            except (ValueError, IndexError):
+                pass
+        return response_times
+
+    def _resolve(self, host: str) -> Tuple[int, Tuple]:
+        """ホスト名を名前解決（DNS_CACHE_TTL秒間キャッシュ）
+        
+        Args:
+            host: IPアドレスまたはホスト名
+            
+        Returns:
+            Tuple[int, Tuple]: アドレスファミリーとソケットアドレス
+            
+        Raises:
+            OSError: 名前解決に失敗した場合
+        """
+        now = time.monotonic()
+        cached = self._dns_cache.get(host)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        family, _, _, _, address = socket.getaddrinfo(
+            host, None, type=socket.SOCK_DGRAM
+        )[0]
+        self._dns_cache[host] = (now + self.DNS_CACHE_TTL, (family, address))
+        return family, address
 
     def check_docker_containers(self) -> List[CheckResult]:
         """Dockerコンテナの状態を確認
@@ -428,116 +1377,173 @@ class MonitoringSystem:
             List[CheckResult]: 各コンテナの状態情報
         """
         results = []
-        for server in self.config['docker_monitoring']['servers']:
-            try:
-                # SSHクライアントの設定
-                ssh = paramiko.SSHClient()
-                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        servers = self.config['docker_monitoring']['servers']
+        for server_results in self._run_concurrently(self._check_docker_server, servers):
+            results.extend(server_results)
+
+        return results
 
-                # SSH接続情報の取得と検証
-                ssh_config = self._get_ssh_config(server)
-                if not ssh_config['username'] or not ssh_config['key_path']:
-                    raise Exception(f"Missing SSH configuration for server {server['host']}")
-
-                # サーバーへの接続
-                ssh.connect(
-                    server['host'],
-                    username=ssh_config['username'],
-                    key_filename=ssh_config['key_path'],
-                    port=ssh_config['port']
+    def _check_docker_server(self, server: Dict[str, Any]) -> List[CheckResult]:
+        """個別サーバー上のDockerコンテナの状態を確認
+        
+        Args:
+            server: サーバー設定を含むdict
+            
+        Returns:
+            List[CheckResult]: サーバー上の各コンテナの状態情報
+        """
+        results = []
+        try:
+            # プール済みのSSH接続を取得
+            ssh = self._get_ssh(server)
+            containers = server['containers']
+
+            # 全コンテナの状態を1回のdocker inspectで取得
+            with self._ssh_channel_limit(server):
+                inspected = self._inspect_containers(ssh, [c['name'] for c in containers])
+
+            # Webコンテナのヘルスチェックを並列実行
+            web_containers = [
+                c for c in containers
+                if c.get('type') == 'web' and c.get('health_check_url')
+            ]
+            health_checks = dict(zip(
+                (c['name'] for c in web_containers),
+                self._run_concurrently(
+                    self._check_web_health,
+                    [c['health_check_url'] for c in web_containers]
                 )
+            ))
 
-                # 各コンテナの状態確認
-                for container in server['containers']:
-                    container_status = self._check_container_via_ssh(ssh, container)
-                    container_status['host'] = server['host']
-                    
-                    if container_status.get('status') == 'NOT_FOUND':
-                        status = CheckStatus.NOT_FOUND
-                    elif container_status.get('status', '').startswith('Up'):
+            # 各コンテナの状態確認
+            for container in containers:
+                inspect_data = inspected.get(container['name'])
+                if inspect_data is None:
+                    status = CheckStatus.NOT_FOUND
+                    container_status = {
+                        'name': container['name'],
+                        'status': 'NOT_FOUND'
+                    }
+                else:
+                    state = inspect_data.get('State', {})
+                    if state.get('Running') and not state.get('Restarting'):
                         status = CheckStatus.OK
                     else:
                         status = CheckStatus.ERROR
-                    
-                    results.append(CheckResult(
-                        name=container['name'],
-                        status=status,
-                        timestamp=datetime.now().isoformat(),
-                        details=container_status
-                    ))
+                    container_status = {
+                        'name': container['name'],
+                        'status': state.get('Status', 'unknown'),
+                        'created': inspect_data.get('Created'),
+                        'state': state
+                    }
 
-            except Exception as e:
-                self.logger.error(f"Failed to connect to server {server['host']}: {e}")
-                results.append(CheckResult(
-                    name=f"server_{server['host']}",
-                    status=CheckStatus.ERROR,
-                    timestamp=datetime.now().isoformat(),
-                    details={'error': str(e), 'host': server['host']}
+                if container['name'] in health_checks:
+                    container_status['health_check'] = health_checks[container['name']]
+                container_status['host'] = server['host']
+                
+                results.append(self._mk_result(
+                    name=container['name'],
+                    status=status,
+                    details=container_status
                 ))
-            finally:
-                ssh.close()
-
-        return results
 
-    def _check_container_via_ssh(self, ssh, container):
-        """SSHを使用して個別のコンテナ状態確認"""
-        try:
-            # docker ps でコンテナの状態を確認
-            cmd = f"docker ps --filter name=^/{container['name']}$ --format '{{{{.Status}}}}'"
-            stdin, stdout, stderr = ssh.exec_command(cmd)
-            status = stdout.read().decode().strip()
-
-            result = {
-                'name': container['name'],
-                'status': status if status else 'NOT_FOUND'
-            }
-
-            if status:
-                # docker inspect でコンテナの詳細情報を取得
-                cmd = f"docker inspect {container['name']}"
-                stdin, stdout, stderr = ssh.exec_command(cmd)
-                inspect_data = json.loads(stdout.read().decode())[0]
+        except Exception as e:
+            self._discard_ssh(server)
+            self.logger.error("Failed to connect to server %s: %s", server['host'], e)
+            results.append(self._mk_result(
+                name=f"server_{server['host']}",
+                status=CheckStatus.ERROR,
+                details={'error': str(e), 'host': server['host']}
+            ))
 
-                result.update({
-                    'created': inspect_data['Created'],
-                    'state': inspect_data['State']
-                })
+        return results
 
-            if container.get('type') == 'web' and container.get('health_check_url'):
-                result['health_check'] = self._check_web_health(container['health_check_url'])
+    def _inspect_containers(self, ssh: paramiko.SSHClient, names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """SSH経由で複数コンテナの詳細情報を一括取得
+        
+        コンテナごとにコマンドを実行せず、1回のdocker inspectで
+        全コンテナの情報をNDJSON形式で取得します。
+        
+        Args:
+            ssh: 接続済みのSSHクライアント
+            names: コンテナ名のリスト
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: コンテナ名をキーとするdocker inspectの結果。
+                存在しないコンテナは含まれません
+        """
+        if not names:
+            return {}
 
-            return result
+        cmd = (
+            "docker inspect --type container --format '{{json .}}' "
+            + " ".join(shlex.quote(name) for name in names)
+            + " 2>/dev/null"
+        )
+        stdin, stdout, stderr = ssh.exec_command(cmd)
 
-        except Exception as e:
-            return {
-                'name': container['name'],
-                'status': 'ERROR',
-                'error': str(e)
-            }
+        inspected = {}
+        for line in stdout.read().splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                self.logger.warning("Could not parse docker inspect output: %r", line[:200])
+                continue
+            inspected[data.get('Name', '').lstrip('/')] = data
+        return inspected
 
     def _check_web_health(self, url):
         """Webアプリケーションの健全性確認（詳細情報付き）"""
         try:
             start_time = time.time()
             # SSL証明書の検証をスキップ
-            response = requests.get(url, timeout=5, verify=False)
+            response = self._http_get(self._get_http_client(verify=False), url, timeout=5)
             response_time = time.time() - start_time
 
-            # 警告メッセージを抑制
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
             return {
                 'status': 'OK' if response.status_code == 200 else 'FAIL',
                 'response_code': response.status_code,
                 'response_time': round(response_time, 3)
             }
-        except requests.RequestException as e:
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
             return {
                 'status': 'FAIL',
                 'error': str(e)
             }
 
+    def _http_get(self, client: httpx.Client, url: str, timeout: float) -> httpx.Response:
+        """到達不可能なホストへの再接続を避けてGETリクエストを送信
+        
+        Args:
+            client: 使用するHTTPクライアント
+            url: リクエスト先のURL
+            timeout: タイムアウト（秒）
+            
+        Returns:
+            httpx.Response: レスポンス
+            
+        Raises:
+            httpx.ConnectError: ホストが直前に到達不可能だった場合
+        """
+        _, host, port = self._url_origin(url)
+        key = ('http', host, port)
+        if self._is_host_down(key):
+            raise httpx.ConnectError(
+                f"Host {host}:{port} was recently unreachable; request skipped"
+            )
+        try:
+            response = client.get(url, timeout=timeout)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            # 接続拒否は即座に返るため、名前解決の失敗とタイムアウトのみ記録
+            if _is_unreachable_error(e):
+                self._mark_host_down(key)
+            raise
+        self._mark_host_up(key)
+        return response
+
     def check_web_health(self) -> List[CheckResult]:
         """Webページのヘルスチェックを実行
         
@@ -551,80 +1557,80 @@ class MonitoringSystem:
         if 'web_health_checks' not in self.config:
             return results
 
-        for target in self.config['web_health_checks'].get('targets', []):
-            try:
-                response = requests.get(
-                    target['url'],
-                    timeout=target.get('timeout', 30),
-                    verify=target.get('verify_ssl', True)
-                )
-                response_time = response.elapsed.total_seconds()
+        targets = self.config['web_health_checks'].get('targets', [])
+        results.extend(self._run_concurrently(self._check_web_target, targets))
 
-                details = {
-                    'url': target['url'],
-                    'response_code': response.status_code,
-                    'response_time': response_time
-                }
+        return results
 
-                results.append(CheckResult(
-                    name=target['name'],
-                    status=CheckStatus.OK if response.status_code == 200 else CheckStatus.ERROR,
-                    timestamp=datetime.now().isoformat(),
-                    details=details
-                ))
+    def _check_web_target(self, target: Dict[str, Any]) -> CheckResult:
+        """個別URLのヘルスチェックを実行
+        
+        Args:
+            target: ヘルスチェック対象の設定を含むdict
+            
+        Returns:
+            CheckResult: ヘルスチェック結果
+        """
+        try:
+            client = self._get_http_client(
+                verify=target.get('verify_ssl', True),
+                max_connections=target.get('max_connections_per_host'),
+                url=target['url']
+            )
+            response = self._http_get(client, target['url'], timeout=target.get('timeout', 30))
+            response_time = response.elapsed.total_seconds()
 
-            except requests.RequestException as e:
-                self.logger.error(f"Failed to check {target['name']}: {e}")
-                results.append(CheckResult(
-                    name=target['name'],
-                    status=CheckStatus.ERROR,
-                    timestamp=datetime.now().isoformat(),
-                    details={
-                        'url': target['url'],
-                        'error': str(e)
-                    }
-                ))
+            details = {
+                'url': target['url'],
+                'response_code': response.status_code,
+                'response_time': response_time
+            }
 
-        return results
+            return self._mk_result(
+                name=target['name'],
+                status=CheckStatus.OK if response.status_code == 200 else CheckStatus.ERROR,
+                details=details
+            )
+
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            self.logger.error("Failed to check %s: %s", target['name'], e)
+            return self._mk_result(
+                name=target['name'],
+                status=CheckStatus.ERROR,
+                details={
+                    'url': target['url'],
+                    'error': str(e)
+                }
+            )
 
     def _save_results(self, data: List[CheckResult], category: str) -> None:
-        """監視結果を指定されたカテゴリのJSONファイルに保存
+        """監視結果を指定されたカテゴリのJSON Linesファイルに追記
+        
+        1件の結果を1行のJSONとして追記するため、既存データの読み込みと
+        ファイル全体の書き直しは発生しません。
         
         Args:
             data: 保存するCheckResultのリスト
             category: データのカテゴリ（logs/ping/docker/web_health）
         """
-        timestamp = datetime.now().strftime('%Y%m%d')
+        timestamp = self._now().strftime('%Y%m%d')
         category_dir = os.path.join(self.config['storage']['output_folder'], category)
-        filename = f"{category}_{timestamp}.json"
+        filename = f"{category}_{timestamp}.jsonl"
         path = os.path.join(category_dir, filename)
 
-        os.makedirs(category_dir, exist_ok=True)
-
-        # 既存のデータを読み込む
-        existing_data = []
-        if os.path.exists(path):
-            try:
-                with open(path, 'r') as f:
-                    existing_data = json.load(f)
-            except json.JSONDecodeError:
-                self.logger.warning(f"Could not read existing data from {path}")
-
-        # 新しいデータを追加
-        new_data = [
-            {
-                'name': result.name,
-                'status': result.status.name,
-                'timestamp': result.timestamp,
-                'details': result.details
-            }
-            for result in data
-        ]
-        existing_data.extend(new_data)
+        # 日付が変わった場合は新しいファイルに切り替え、削除された場合は作り直す
+        f = self._result_files.get(category)
+        if f is None or f.name != path or os.fstat(f.fileno()).st_nlink == 0:
+            if f is not None:
+                f.close()
+            f = self._result_files[category] = self._write_in_dir(
+                category_dir, open, path, 'ab'
+            )
 
-        # データを保存
-        with open(path, 'w') as f:
-            json.dump(existing_data, f, indent=2)
+        f.write(b''.join(
+            orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS) + b'\n' for result in data
+        ))
+        f.flush()
 
     def save_results(self, data: List[CheckResult], category: str) -> None:
         """監視結果をファイルに保存
@@ -637,27 +1643,13 @@ class MonitoringSystem:
             category: データのカテゴリ（logs/ping/docker/web_health）
         """
         # 結果の保存
-        timestamp = datetime.now().strftime('%Y%m%d')
+        timestamp = self._now().strftime('%Y%m%d')
         category_dir = os.path.join(self.config['storage']['output_folder'], category)
         filename = f"{category}_{timestamp}.json"
         path = os.path.join(category_dir, filename)
 
-        os.makedirs(category_dir, exist_ok=True)
-
-        # 新しいデータを保存用に変換
-        new_data = [
-            {
-                'name': result.name,
-                'status': result.status.name,
-                'timestamp': result.timestamp,
-                'details': result.details
-            }
-            for result in data
-        ]
-
         # データを保存（上書き）
-        with open(path, 'w') as f:
-            json.dump(new_data, f, indent=2)
+        self._write_in_dir(category_dir, _dump, data, path)
 
         # サマリーの作成と保存
         if category in ['ping', 'docker', 'web_health']:
@@ -668,82 +1660,72 @@ class MonitoringSystem:
     def _update_summary(self, category: str, data: List[CheckResult]) -> None:
         """監視結果のサマリーを更新
         
+        サマリーはカテゴリごとに summary/<カテゴリ>.json に保存し、
+        summary/index.json に各カテゴリの内容のハッシュと更新時刻を記録します。
+        前回から内容が変わっていないカテゴリは書き込みを行いません。
+        
         Args:
             category: データのカテゴリ（ping/docker/web_health）
             data: 新しい監視結果データ
         """
-        summary_path = os.path.join(
-            self.config['storage']['output_folder'],
-            'monitoring_summary.json'
-        )
-
-        # 出力ディレクトリが存在しない場合は作成
-        os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+        summary_dir = os.path.join(self.config['storage']['output_folder'], 'summary')
+        index_path = os.path.join(summary_dir, 'index.json')
+
+        # 前回のハッシュを読み込む（初回のみ）
+        if self._summary_index is None:
+            self._summary_index = {}
+            if os.path.exists(index_path):
+                try:
+                    self._summary_index = _load(index_path)
+                except (orjson.JSONDecodeError, FileNotFoundError):
+                    self.logger.warning("Could not read existing summary index")
 
-        # 既存のサマリーを読み込む
-        summary = {}
-        if os.path.exists(summary_path):
-            try:
-                with open(summary_path, 'r') as f:
-                    summary = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                self.logger.warning("Could not read existing summary")
-        
         # カテゴリごとにサマリーを作成
         if category == 'ping':
-            # ping_targetsから対象のホスト情報を取得
-            ping_targets = {
-                target['name']: target['host']
-                for target in self.config['ping_targets']
-            }
-
-            summary['ping'] = [
+            entries = [
                 {
                     'name': result.name,
-                    'ip': ping_targets.get(result.name, 'unknown'),
-                    'status': result.status.name,
+                    'ip': self._ping_target_by_name.get(result.name, {}).get('host', 'unknown'),
+                    'status': result.status,
                     'details': result.details
                 }
                 for result in data
             ]
         elif category == 'docker':
-            # docker_monitoringから対象のサーバー情報を取得
-            server_info = {
-                server['host']: {
-                    'name': next(
-                        (target['name'] for target in self.config['ping_targets']
-                         if target['host'] == server['host']),
-                        'unknown'
-                    ),
-                    'ip': server['host']
-                }
-                for server in self.config['docker_monitoring']['servers']
-            }
-
-            summary['docker'] = [
+            # ping_targetsに登録されたホスト名をサーバー名として付与
+            entries = [
                 {
                     'name': result.name,
-                    'status': result.status.name,
+                    'server': self._ping_target_by_host.get(
+                        result.details.get('host'), {}
+                    ).get('name', 'unknown'),
+                    'ip': result.details.get('host', 'unknown'),
+                    'status': result.status,
                     'details': result.details
                 }
                 for result in data
             ]
         elif category == 'web_health':
-            summary['web_health'] = [
-                {
-                    'name': result.name,
-                    'status': result.status.name,
-                    'details': result.details
-                }
-                for result in data
-            ]
-
-        # タイムスタンプを追加
-        summary['last_updated'] = datetime.now().isoformat()
-
-        # サマリーを保存
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+            # 追加項目がないため、CheckResultをそのまま出力
+            entries = data
+        else:
+            return
+
+        content = orjson.dumps(entries, option=_JSON_OPTIONS)
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        category_path = os.path.join(summary_dir, f"{category}.json")
+
+        # 内容が変わっていなければ書き込まない
+        previous = self._summary_index.get(category)
+        if previous and previous.get('hash') == digest and os.path.exists(category_path):
+            return
+
+        self._write_in_dir(summary_dir, _atomic_write_bytes, category_path, content)
+        self._summary_index[category] = {
+            'hash': digest,
+            'last_updated': self._now().isoformat()
+        }
+        self._write_in_dir(summary_dir, _dump, self._summary_index, index_path)
 
     def _update_log_summary(self, data: List[CheckResult]) -> None:
         """ログ収集結果のサマリーを更新
@@ -756,7 +1738,7 @@ class MonitoringSystem:
             'log_summary.log'
         )
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = self._now().strftime('%Y-%m-%d %H:%M:%S')
         
         # サマリー情報を作成
         summary_lines = [f"=== Log Collection ({timestamp}) ===\n"]
@@ -776,26 +1758,28 @@ class MonitoringSystem:
                 if log.status == CheckStatus.OK:
                     # 正常に収集されたログの処理
                     try:
-                        with open(log.details['local_path'], 'r', encoding='utf-8') as f:
-                            content = f.read().strip()
-                            lines = content.split('\n')
-                            line_count = len(lines)
-                            
-                            if line_count > 0:
-                                summary_lines.extend([
-                                    f"  Source: {log.details['source_path']}",
-                                    f"  Status: Successfully collected",
-                                    f"  Lines: {line_count}",
-                                    f"  Content:",
-                                    "    " + "\n    ".join(lines)  # 全行を出力
-                                ])
+                        line_count, tail = self._read_log_stats(log.details['local_path'])
+                        
+                        if line_count > 0:
+                            content_preview = b'\n'.join(tail).decode('utf-8', errors='replace')
+                            if line_count > len(tail):
+                                content_label = f"  Content (last {len(tail)} lines):"
                             else:
-                                summary_lines.extend([
-                                    f"  Source: {log.details['source_path']}",
-                                    f"  Status: Successfully collected",
-                                    f"  Lines: 0",
-                                    f"  Content: (empty file)"
-                                ])
+                                content_label = "  Content:"
+                            summary_lines.extend([
+                                f"  Source: {log.details['source_path']}",
+                                f"  Status: Successfully collected",
+                                f"  Lines: {line_count}",
+                                content_label,
+                                textwrap.indent(content_preview.rstrip(), "    ", lambda line: True)
+                            ])
+                        else:
+                            summary_lines.extend([
+                                f"  Source: {log.details['source_path']}",
+                                f"  Status: Successfully collected",
+                                f"  Lines: 0",
+                                f"  Content: (empty file)"
+                            ])
                     except Exception as e:
                         summary_lines.extend([
                             f"  Source: {log.details['source_path']}",
@@ -813,9 +1797,51 @@ class MonitoringSystem:
         
         summary_lines.append("-" * 80 + "\n")
         
-        # サマリーを追記モードで保存
-        with open(summary_path, 'a', encoding='utf-8') as f:
-            f.write('\n'.join(summary_lines))
+        # サマリーを追記モードで保存（ファイルは開いたまま保持し、削除された場合は作り直す）
+        f = self._log_summary_file
+        if f is None or f.name != summary_path or os.fstat(f.fileno()).st_nlink == 0:
+            if f is not None:
+                f.close()
+            f = self._log_summary_file = self._write_in_dir(
+                os.path.dirname(summary_path), open, summary_path, 'ab'
+            )
+        f.write('\n'.join(summary_lines).encode('utf-8'))
+        f.flush()
+
+    def _read_log_stats(self, path: str) -> Tuple[int, List[bytes]]:
+        """ログファイルの行数と末尾の行を取得
+        
+        行数は固定サイズのチャンクごとにbytes.countで改行を数えるため、
+        1行ずつのPython処理やファイル全体の読み込みは発生しません。
+        末尾の行はファイル末尾の LOG_SUMMARY_TAIL_BYTES バイトのみから取得します。
+        
+        Args:
+            path: ログファイルのパス
+            
+        Returns:
+            Tuple[int, List[bytes]]: 行数と、末尾の最大 LOG_SUMMARY_TAIL_LINES 行
+        """
+        with open(path, 'rb') as f:
+            line_count = 0
+            last_byte = b''
+            for chunk in iter(partial(f.read, self.LOG_COUNT_CHUNK_SIZE), b''):
+                line_count += chunk.count(b'\n')
+                last_byte = chunk[-1:]
+            # 改行で終わらない最終行
+            if last_byte and last_byte != b'\n':
+                line_count += 1
+            if line_count == 0:
+                return 0, []
+
+            size = f.tell()
+            f.seek(max(0, size - self.LOG_SUMMARY_TAIL_BYTES))
+            tail = f.read()
+
+        lines = tail.rstrip(b'\n').split(b'\n')
+        # 途中から読み込んだ先頭の行は除外
+        if size > self.LOG_SUMMARY_TAIL_BYTES and len(lines) > 1:
+            lines = lines[1:]
+        return line_count, lines[-self.LOG_SUMMARY_TAIL_LINES:]
 
     def _write_check_summary(self, results: Dict[str, List[CheckResult]]) -> None:
         """監視結果のサマリーをcheck_summary.jsonに出力
@@ -829,30 +1855,18 @@ class MonitoringSystem:
             'check_summary.json'
         )
         
-        # 出力ディレクトリが存在しない場合は作成
-        os.makedirs(os.path.dirname(summary_path), exist_ok=True)
-        
         summary = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._wave_ts or datetime.now().isoformat(),
             'results': {}
         }
         
         # カテゴリごとにサマリーを作成
         for category, data in results.items():
             if category in ['docker', 'ping', 'web_health']:
-                summary['results'][category] = [
-                    {
-                        'name': result.name,
-                        'status': result.status.name,
-                        'timestamp': result.timestamp,
-                        'details': result.details
-                    }
-                    for result in data
-                ]
+                summary['results'][category] = data
         
         # check_summary.jsonを保存
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        self._write_in_dir(os.path.dirname(summary_path), _dump, summary, summary_path)
 
         # ログのサマリーを作成（log_summary.log）
         if 'logs' in results:
@@ -870,26 +1884,18 @@ class MonitoringSystem:
             'error_summary.json'
         )
 
-        # 出力ディレクトリが存在しない場合は作成
-        os.makedirs(os.path.dirname(error_summary_path), exist_ok=True)
-
         error_summary = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._wave_ts or datetime.now().isoformat(),
             'results': {}
         }
 
         # カテゴリごとにエラーのみを抽出
+        ok = CheckStatus.OK
         for category, data in results.items():
-            if category in ['docker', 'ping', 'web_health']:
+            if category in ('docker', 'ping', 'web_health'):
                 error_results = [
-                    {
-                        'name': result.name,
-                        'status': result.status.name,
-                        'timestamp': result.timestamp,
-                        'details': result.details
-                    }
-                    for result in data
-                    if result.status != CheckStatus.OK
+                    result for result in data
+                    if result.status is not ok
                 ]
                 # エラーが存在する場合のみ追加
                 if error_results:
@@ -897,8 +1903,9 @@ class MonitoringSystem:
 
         # エラーが一つもなければファイルを作成しない
         if error_summary['results']:
-            with open(error_summary_path, 'w') as f:
-                json.dump(error_summary, f, indent=2, ensure_ascii=False)
+            self._write_in_dir(
+                os.path.dirname(error_summary_path), _dump, error_summary, error_summary_path
+            )
 
     def validate_config(self) -> Optional[str]:
         """設定ファイルの検証
@@ -910,97 +1917,95 @@ class MonitoringSystem:
         """
         try:
             # 必須セクションの確認
-            required_sections = ['log_collection', 'ping_targets', 'docker_monitoring', 'storage']
-            for section in required_sections:
+            for section in _REQUIRED_SECTIONS:
                 if section not in self.config:
-                    return f"Missing required section: {section}"
+                    return _ERR_MISSING_SECTION(section)
 
             # ストレージ設定の検証
             if 'output_folder' not in self.config['storage']:
-                return "Missing 'output_folder' in storage configuration"
+                return _ERR_MISSING_OUTPUT_FOLDER
             if not os.path.exists(self.config['storage']['output_folder']):
-                return f"Storage directory does not exist: {self.config['storage']['output_folder']}"
+                return _ERR_STORAGE_NOT_FOUND(self.config['storage']['output_folder'])
 
             # ログ収集設定の検証
             for server in self.config['log_collection'].get('servers', []):
-                missing_fields = []
-                for field in ['name', 'host', 'log_paths']:
-                    if field not in server:
-                        missing_fields.append(field)
-                if missing_fields:
-                    return f"Missing required fields {missing_fields} in log_collection server configuration"
+                error = _check_required_fields(server, 'log_collection server')
+                if error:
+                    return error
                 if not isinstance(server['log_paths'], list):
-                    return f"'log_paths' must be a list for server {server['name']}"
+                    return _ERR_LOG_PATHS_NOT_LIST(server['name'])
 
             # Ping設定の検証
             if not isinstance(self.config['ping_targets'], list):
-                return "'ping_targets' must be a list"
+                return _ERR_PING_TARGETS_NOT_LIST
             for target in self.config['ping_targets']:
-                missing_fields = []
-                for field in ['name', 'host']:
-                    if field not in target:
-                        missing_fields.append(field)
-                if missing_fields:
-                    return f"Missing required fields {missing_fields} in ping_targets configuration"
+                error = _check_required_fields(target, 'ping_targets')
+                if error:
+                    return error
 
             # Dockerコンテナ監視設定の検証
             docker_config = self.config['docker_monitoring']
             if 'servers' not in docker_config:
-                return "Missing 'servers' in docker_monitoring configuration"
+                return _ERR_MISSING_DOCKER_SERVERS
             
             for server in docker_config['servers']:
                 # サーバー設定の検証
-                missing_fields = []
-                for field in ['host', 'containers']:
-                    if field not in server:
-                        missing_fields.append(field)
-                if missing_fields:
-                    return f"Missing required fields {missing_fields} in docker_monitoring server configuration"
+                error = _check_required_fields(server, 'docker_monitoring server')
+                if error:
+                    return error
                 
                 # コンテナ設定の検証
                 if not isinstance(server['containers'], list):
-                    return f"'containers' must be a list for server {server['host']}"
+                    return _ERR_CONTAINERS_NOT_LIST(server['host'])
                 
                 for container in server['containers']:
                     if 'name' not in container:
-                        return f"Missing 'name' in container configuration for server {server['host']}"
+                        return _ERR_MISSING_CONTAINER_NAME(server['host'])
                     
                     # Webコンテナの場合、health_check_urlが必要
                     if container.get('type') == 'web' and 'health_check_url' not in container:
-                        return f"Missing 'health_check_url' for web container {container['name']}"
+                        return _ERR_MISSING_HEALTH_CHECK_URL(container['name'])
 
             # SSH設定の検証（デフォルト設定がある場合）
             if 'default_ssh' in self.config:
-                ssh_config = self.config['default_ssh']
-                missing_fields = []
-                for field in ['username', 'key_path']:
-                    if field not in ssh_config:
-                        missing_fields.append(field)
-                if missing_fields:
-                    return f"Missing required fields {missing_fields} in default_ssh configuration"
+                error = _check_required_fields(self.config['default_ssh'], 'default_ssh')
+                if error:
+                    return error
 
             # Webヘルスチェック設定の検証（オプショナル）
             if 'web_health_checks' in self.config:
                 if 'targets' not in self.config['web_health_checks']:
-                    return "Missing 'targets' in web_health_checks configuration"
+                    return _ERR_MISSING_WEB_TARGETS
                 
                 for target in self.config['web_health_checks']['targets']:
-                    missing_fields = []
-                    for field in ['name', 'url']:
-                        if field not in target:
-                            missing_fields.append(field)
-                    if missing_fields:
-                        return f"Missing required fields {missing_fields} in web_health_checks target configuration"
+                    error = _check_required_fields(target, 'web_health_checks target')
+                    if error:
+                        return error
 
             return None
         except Exception as e:
-            return f"Configuration validation error: {str(e)}"
+            return _ERR_VALIDATION(e)
 
     def __enter__(self):
         """コンテキストマネージャー"""
         return self
 
+    def close(self) -> None:
+        """バックグラウンド監視を停止し、保持している接続を解放"""
+        self.stop_background()
+        with self._http_lock:
+            clients = list(self._http_clients.values())
+            self._http_clients.clear()
+        for client in clients:
+            client.close()
+        self.close_all_ssh()
+        for f in self._result_files.values():
+            f.close()
+        self._result_files.clear()
+        if self._log_summary_file is not None:
+            self._log_summary_file.close()
+            self._log_summary_file = None
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """クリーンアップ"""
-        # 必要なったらリソースのクリーンアップを追加する
-        pass
+        self.close()
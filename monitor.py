@@ -31,10 +31,9 @@ BeaconBase - インフラ統合監視システム
 
 import argparse
 import sys
-import os
 import logging
 from typing import Optional
-from beaconbase import MonitoringSystem, MonitoringError
+from beaconbase import MonitoringSystem, MonitoringError, CheckStatus
 
 
 class MonitoringCLI:
@@ -112,21 +111,21 @@ class MonitoringCLI:
         self.logger.info("Starting BeaconBase monitoring system...")
 
         try:
-            config_file_path = self.args.config if self.args.config else os.path.join(os.path.dirname(os.path.abspath(self.args.config)), str(self.args.config))
-            with MonitoringSystem(config_file_path) as monitor:
+            with MonitoringSystem(self.args.config) as monitor:
                 # 設定ファイルの検証
                 validation_error = monitor.validate_config()
                 if validation_error:
-                    self.logger.error(f"Configuration error: {validation_error}")
+                    self.logger.error("Configuration error: %s", validation_error)
                     return self.EXIT_ERROR
 
                 # 監視の実行
                 self.logger.info("Running monitoring checks...")
                 results = monitor.run_all_checks()
 
-                # 結果の確認
+                # 結果の確認（最初のエラーで打ち切り）
+                error = CheckStatus.ERROR
                 has_errors = any(
-                    result.status == 'ERROR'
+                    result.status is error
                     for category in results.values()
                     for result in category
                 )
@@ -142,10 +141,10 @@ class MonitoringCLI:
             self.logger.info("Monitoring interrupted by user")
             return self.EXIT_KEYBOARD_INTERRUPT
         except MonitoringError as e:
-            self.logger.error(f"Monitoring system error: {e}")
+            self.logger.error("Monitoring system error: %s", e)
             return self.EXIT_ERROR
         except Exception as e:
-            self.logger.error(f"Unexpected error: {e}", exc_info=True)
+            self.logger.error("Unexpected error: %s", e, exc_info=True)
             return self.EXIT_ERROR
 
 
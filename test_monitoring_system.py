@@ -8,7 +8,13 @@ BeaconBase テストモジュール
 import pytest
 import tempfile
 import os
+import shutil
 import json
+import socket
+import struct
+import errno
+import threading
+import time
 from unittest.mock import Mock, patch, mock_open
 from datetime import datetime
 from beaconbase import (
@@ -16,14 +22,15 @@ from beaconbase import (
     MonitoringError,
     RetryableError,
     CheckStatus,
-    CheckResult
+    CheckResult,
+    _PingSocket
 )
 import docker
 import paramiko
-import ping3
-import requests
+import httpx
 import yaml
 from typing import Dict, Any
+from monitor import MonitoringCLI
 from unittest.mock import MagicMock
 
 
@@ -99,6 +106,132 @@ def monitoring_system(config_file: str) -> MonitoringSystem:
         yield system
 
 
+class FakeStdout:
+    """SSHコマンドの標準出力の代替"""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+
+class FakeTransport:
+    """paramiko.Transportの代替"""
+
+    def __init__(self):
+        self.active = True
+        self.keepalive = None
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def set_keepalive(self, interval: int) -> None:
+        self.keepalive = interval
+
+
+class FakeSFTP:
+    """paramiko.SFTPClientの代替
+
+    filesに含まれるパスの内容を返し、それ以外はファイルが存在しないものとして扱います。
+    errorsに含まれるパスは対応する例外を送出します。
+    """
+
+    def __init__(self, client: 'FakeSSHClient'):
+        self._client = client
+        self._active = 0
+
+    def getfo(self, remotepath: str, fl, prefetch: bool = True) -> None:
+        if remotepath in self._client.errors:
+            raise self._client.errors[remotepath]
+        if remotepath not in self._client.files:
+            raise IOError(errno.ENOENT, 'No such file')
+        # 同じSFTPClientを複数スレッドから同時に使用したかを記録
+        with self._client.lock:
+            self._active += 1
+            self._client.max_sftp_overlap = max(self._client.max_sftp_overlap, self._active)
+        try:
+            time.sleep(self._client.transfer_delay)
+            fl.write(self._client.files[remotepath])
+        finally:
+            with self._client.lock:
+                self._active -= 1
+
+    def remove(self, path: str) -> None:
+        self._client.files.pop(path, None)
+
+    def close(self) -> None:
+        with self._client.lock:
+            self._client.open_channels -= 1
+
+
+class FakeSSHClient:
+    """paramiko.SSHClientの軽量な代替
+
+    exec_commandは、コマンドの先頭に一致するrepliesのキーに対応する出力を返します。
+    """
+
+    def __init__(self, replies: Dict[str, bytes]):
+        self.replies = replies
+        self.commands = []
+        self.connect_count = 0
+        self.close_count = 0
+        self.transport = FakeTransport()
+        self.files: Dict[str, bytes] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.lock = threading.Lock()
+        self.open_channels = 0
+        self.max_open_channels = 0
+        self.max_sftp_overlap = 0
+        self.transfer_delay = 0.0
+
+    def set_missing_host_key_policy(self, policy) -> None:
+        pass
+
+    def connect(self, hostname: str, **kwargs) -> None:
+        self.connect_count += 1
+        self.transport.active = True
+
+    def get_transport(self) -> FakeTransport:
+        return self.transport
+
+    def exec_command(self, command: str):
+        self.commands.append(command)
+        for prefix, reply in self.replies.items():
+            if command.startswith(prefix):
+                return None, FakeStdout(reply), None
+        return None, FakeStdout(b''), None
+
+    def open_sftp(self) -> FakeSFTP:
+        with self.lock:
+            self.open_channels += 1
+            self.max_open_channels = max(self.max_open_channels, self.open_channels)
+        return FakeSFTP(self)
+
+    def close(self) -> None:
+        self.close_count += 1
+
+
+@pytest.fixture(scope='session')
+def fake_ssh_class():
+    """SSHクライアントの代替クラス"""
+    return FakeSSHClient
+
+
+@pytest.fixture
+def ssh_replies() -> Dict[str, bytes]:
+    """テストごとのSSHコマンドの出力（コマンドの先頭 -> 出力）"""
+    return {}
+
+
+@pytest.fixture
+def fake_ssh(fake_ssh_class, ssh_replies: Dict[str, bytes]):
+    """paramiko.SSHClientを代替クラスに置き換え"""
+    client = fake_ssh_class(ssh_replies)
+    with patch('paramiko.SSHClient', new=lambda: client):
+        yield client
+
+
 class TestMonitoringSystem:
     """MonitoringSystemクラスのテスト"""
 
@@ -108,10 +241,50 @@ class TestMonitoringSystem:
             mock_exists.return_value = True
             assert monitoring_system.validate_config() is None
 
+    @pytest.mark.parametrize('content', ['', '- item\n', 'just a string\n'])
+    def test_config_not_mapping(self, temp_dir: str, content: str):
+        """マッピングでない設定ファイルのテスト"""
+        config_path = os.path.join(temp_dir, 'config.yaml')
+        with open(config_path, 'w') as f:
+            f.write(content)
+
+        with pytest.raises(MonitoringError, match='must be a mapping'):
+            MonitoringSystem(config_path)
+
+    @pytest.mark.parametrize('default_ssh', ['x', ['test_user', '/tmp/test_key']])
+    def test_config_default_ssh_not_mapping(self, config_data: Dict[str, Any], temp_dir: str,
+                                            default_ssh):
+        """default_sshがマッピングでない設定の検証テスト"""
+        config_data['default_ssh'] = default_ssh
+        config_path = os.path.join(temp_dir, 'config.yaml')
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+
+        with MonitoringSystem(config_path) as system:
+            error = system.validate_config()
+        assert error == "Missing required fields ['username', 'key_path'] in default_ssh configuration"
+
+    def test_config_cache(self, config_data: Dict[str, Any], temp_dir: str):
+        """解析済み設定のキャッシュのテスト"""
+        config_data['storage']['enable_config_cache'] = True
+        config_path = os.path.join(temp_dir, 'config.yaml')
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+
+        with MonitoringSystem(config_path) as system:
+            assert system.config == config_data
+        assert os.path.exists(os.path.join(temp_dir, MonitoringSystem.CONFIG_CACHE_FILENAME))
+
+        # 設定ファイルが変更されていなければYAMLを解析しない
+        with patch('yaml.load') as mock_load:
+            with MonitoringSystem(config_path) as system:
+                assert system.config == config_data
+            mock_load.assert_not_called()
+
     def test_ping_check_success(self, monitoring_system: MonitoringSystem):
         """Ping成功時のテスト"""
-        with patch('ping3.ping') as mock_ping:
-            mock_ping.return_value = 0.123  # 応答時間（秒）
+        with patch.object(MonitoringSystem, '_ping_hosts') as mock_ping:
+            mock_ping.return_value = {'192.168.1.1': 0.123}  # 応答時間（秒）
 
             results = monitoring_system.check_ping()
             assert len(results) == 1
@@ -123,8 +296,8 @@ class TestMonitoringSystem:
 
     def test_ping_check_failure(self, monitoring_system: MonitoringSystem):
         """Ping失敗時のテスト"""
-        with patch('ping3.ping') as mock_ping:
-            mock_ping.return_value = None  # 到達不可能
+        with patch.object(MonitoringSystem, '_ping_hosts') as mock_ping:
+            mock_ping.return_value = {'192.168.1.1': None}  # 到達不可能
 
             results = monitoring_system.check_ping()
             assert len(results) == 1
@@ -134,43 +307,226 @@ class TestMonitoringSystem:
             assert 'error' in results[0].details
             assert results[0].details['error'] == 'Host unreachable'
 
-    def test_docker_container_check(self, monitoring_system: MonitoringSystem):
+    def test_ping_fping_fallback(self, monitoring_system: MonitoringSystem):
+        """ICMPソケットを作成できない場合のfpingによるPingのテスト"""
+        completed = Mock(stderr="192.168.1.1 : 0.52\n192.168.1.2 : -\n")
+        with patch('beaconbase._PingSocket', side_effect=PermissionError), \
+                patch('shutil.which', return_value='/usr/bin/fping'), \
+                patch('subprocess.run', return_value=completed) as mock_run:
+            response_times = monitoring_system._ping_hosts(['192.168.1.1', '192.168.1.2'])
+            assert response_times['192.168.1.1'] == pytest.approx(0.00052)
+            assert response_times['192.168.1.2'] is None
+            assert mock_run.call_count == 1
+
+    def test_ping_checksum(self):
+        """ICMPチェックサム計算のテスト"""
+        header = struct.pack('!BBHHH', 8, 0, 0, 0x1234, 1)
+        checksum = _PingSocket._checksum(header + b'BeaconBase')
+        packet = struct.pack('!BBHHH', 8, 0, checksum, 0x1234, 1) + b'BeaconBase'
+        # チェックサムを含めたパケット全体の1の補数和は0になる
+        assert _PingSocket._checksum(packet) == 0
+
+    @pytest.mark.parametrize('packet, expected', [
+        # IPヘッダー（20バイト）付きのEcho応答
+        (bytes([0x45]) + bytes(19) + struct.pack('!BBHHH', 0, 0, 0, 0x1234, 7), (7, '192.0.2.1')),
+        # オプション付きのIPヘッダー（24バイト）
+        (bytes([0x46]) + bytes(23) + struct.pack('!BBHHH', 0, 0, 0, 0x1234, 8), (8, '192.0.2.1')),
+        # 他のプロセス宛ての応答
+        (bytes([0x45]) + bytes(19) + struct.pack('!BBHHH', 0, 0, 0, 0x4321, 7), None),
+        # 自身が送信したEcho要求
+        (bytes([0x45]) + bytes(19) + struct.pack('!BBHHH', 8, 0, 0, 0x1234, 7), None),
+        # ICMPヘッダーに満たないパケット
+        (bytes([0x45]) + bytes(19) + b'\x00\x00', None),
+    ], ids=['reply', 'ip-options', 'other-ident', 'echo-request', 'truncated'])
+    def test_ping_socket_receive(self, packet: bytes, expected):
+        """rawソケットでのEcho応答の受信テスト"""
+        with patch('beaconbase.socket.socket') as mock_socket:
+            mock_socket.return_value.recvfrom.return_value = (packet, ('192.0.2.1', 0))
+            ping_socket = _PingSocket(socket.AF_INET, 0x1234)
+            assert ping_socket.raw
+            assert ping_socket.receive() == expected
+
+    @pytest.mark.parametrize('source, reachable', [
+        ('192.0.2.1', True),
+        ('192.0.2.99', False),
+    ])
+    def test_ping_reply_source(self, monitoring_system: MonitoringSystem,
+                               source: str, reachable: bool):
+        """送信先以外からの応答を到達の判定に使用しないテスト"""
+        monitoring_system.ping_timeout = 0.2
+        ping_socket = Mock(family=socket.AF_INET)
+        ping_socket.receive.side_effect = [(0, source), None]
+        readable = [([ping_socket], [], [])] * 2
+        with patch('beaconbase._PingSocket', return_value=ping_socket), \
+                patch('beaconbase.select.select',
+                      side_effect=lambda *args: readable.pop() if readable else ([], [], [])):
+            response_times = monitoring_system._ping_hosts(['192.0.2.1'])
+        assert (response_times['192.0.2.1'] is not None) == reachable
+
+    def test_docker_container_check(self, monitoring_system: MonitoringSystem,
+                                    fake_ssh: FakeSSHClient, ssh_replies: Dict[str, bytes]):
         """Dockerコンテナ確認機能のテスト（SSH経由）"""
-        with patch('paramiko.SSHClient') as mock_ssh:
-            mock_ssh_instance = Mock()
-            mock_ssh.return_value = mock_ssh_instance
-
-            # docker ps のモック
-            mock_stdout_ps = Mock()
-            mock_stdout_ps.read.return_value = b'Up 2 days'
-            mock_stdout_ps.channel.recv_exit_status.return_value = 0
-
-            # docker inspect のモック
-            mock_stdout_inspect = Mock()
-            inspect_data = {
-                'Created': '2023-01-01T00:00:00Z',
-                'State': {'Status': 'running', 'Running': True}
+        # docker inspect の出力（NDJSON形式で一括取得）
+        inspect_data = {
+            'Name': '/test_container',
+            'Created': '2023-01-01T00:00:00Z',
+            'State': {'Status': 'running', 'Running': True}
+        }
+        ssh_replies['docker inspect'] = (json.dumps(inspect_data) + '\n').encode()
+
+        results = monitoring_system.check_docker_containers()
+        assert len(results) == 1
+        assert results[0].status == CheckStatus.OK
+        assert results[0].name == "test_container"
+        assert isinstance(results[0].timestamp, str)
+        assert results[0].details['status'] == 'running'
+        assert results[0].details['host'] == '127.0.0.1'
+        assert results[0].details['state']['Status'] == 'running'
+        assert len(fake_ssh.commands) == 1
+
+    def test_ssh_connection_reuse(self, monitoring_system: MonitoringSystem,
+                                  fake_ssh: FakeSSHClient):
+        """SSH接続の再利用と切断時の再接続のテスト"""
+        server = monitoring_system.config['docker_monitoring']['servers'][0]
+        ssh_config = monitoring_system._get_ssh_config(server)
+        assert ssh_config is monitoring_system._get_ssh_config(server)
+        assert ssh_config.key == ('127.0.0.1', 22, 'test_user2')
+        assert ssh_config.key_path == '/tmp/test_key2'
+
+        assert monitoring_system._get_ssh(server) is monitoring_system._get_ssh(server)
+        assert fake_ssh.connect_count == 1
+        assert fake_ssh.transport.keepalive == MonitoringSystem.SSH_KEEPALIVE_INTERVAL
+
+        # 切断された接続は破棄して再接続する
+        fake_ssh.transport.active = False
+        monitoring_system._get_ssh(server)
+        assert fake_ssh.close_count == 1
+        assert fake_ssh.connect_count == 2
+
+    def test_collect_logs_shared_connection(self, monitoring_system: MonitoringSystem,
+                                            fake_ssh: FakeSSHClient):
+        """同じ接続を共有する複数サーバーからの並列ログ収集のテスト"""
+        servers = [
+            {
+                'name': f"server{i}",
+                'host': "127.0.0.1",
+                'log_paths': [f"/var/log/server{i}_{j}.log" for j in range(8)]
             }
-            mock_stdout_inspect.read.return_value = json.dumps([inspect_data]).encode()
-            mock_stdout_inspect.channel.recv_exit_status.return_value = 0
-
-            mock_ssh_instance.exec_command.side_effect = [
-                (None, mock_stdout_ps, None),
-                (None, mock_stdout_inspect, None)
-            ]
-
-            results = monitoring_system.check_docker_containers()
-            assert len(results) == 1
-            assert results[0].status == CheckStatus.OK
-            assert results[0].name == "test_container"
-            assert isinstance(results[0].timestamp, str)
-            assert results[0].details['status'] == 'Up 2 days'
-            assert results[0].details['host'] == '127.0.0.1'
-            assert results[0].details['state']['Status'] == 'running'
+            for i in range(2)
+        ]
+        monitoring_system.config['log_collection']['servers'] = servers
+        # 転送を重ならせ、全ワーカーが同時にチャネルを使用する状況を作る
+        fake_ssh.transfer_delay = 0.05
+        for server in servers:
+            for log_path in server['log_paths']:
+                fake_ssh.files[log_path] = b"line\n"
+
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(monitoring_system.collect_logs()), daemon=True
+        )
+        worker.start()
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+
+        assert len(results) == 16
+        assert all(result.status == CheckStatus.OK for result in results)
+        assert fake_ssh.max_open_channels <= MonitoringSystem.MAX_SSH_CHANNELS_PER_HOST
+        assert fake_ssh.open_channels == 0
+
+    def test_collect_logs_single_path_servers(self, monitoring_system: MonitoringSystem,
+                                              fake_ssh: FakeSSHClient):
+        """同じホストのログファイルが1つずつのサーバーを並列に収集するテスト"""
+        servers = [
+            {'name': f"server{i}", 'host': "127.0.0.1", 'log_paths': [f"/var/log/app{i}.log"]}
+            for i in range(4)
+        ]
+        monitoring_system.config['log_collection']['servers'] = servers
+        fake_ssh.transfer_delay = 0.05
+        for server in servers:
+            fake_ssh.files[server['log_paths'][0]] = b"line\n"
+
+        results = monitoring_system.collect_logs()
+        assert len(results) == 4
+        assert all(result.status == CheckStatus.OK for result in results)
+        # SFTPClientはスレッドセーフではないため、転送ごとに別のチャネルを使用する
+        assert fake_ssh.max_sftp_overlap == 1
+        assert fake_ssh.open_channels == 0
+
+    def test_collect_logs_same_basename(self, monitoring_system: MonitoringSystem,
+                                        fake_ssh: FakeSSHClient):
+        """ファイル名が重複するログを別々のファイルに保存するテスト"""
+        log_paths = ["/var/log/app1/error.log", "/var/log/app2/error.log", "/var/log/access.log"]
+        monitoring_system.config['log_collection']['servers'] = [
+            {'name': 'server1', 'host': '127.0.0.1', 'log_paths': log_paths}
+        ]
+        fake_ssh.transfer_delay = 0.05
+        for log_path in log_paths:
+            fake_ssh.files[log_path] = log_path.encode()
+
+        results = monitoring_system.collect_logs()
+        assert all(result.status == CheckStatus.OK for result in results)
+        local_paths = {r.details['source_path']: r.details['local_path'] for r in results}
+        assert os.path.basename(local_paths["/var/log/app1/error.log"]) == "var_log_app1_error.log"
+        assert os.path.basename(local_paths["/var/log/app2/error.log"]) == "var_log_app2_error.log"
+        assert os.path.basename(local_paths["/var/log/access.log"]) == "access.log"
+        for source_path, local_path in local_paths.items():
+            with open(local_path, 'rb') as f:
+                assert f.read() == source_path.encode()
+        # 一時ファイルは残らない
+        log_dir = os.path.dirname(local_paths["/var/log/access.log"])
+        assert not [name for name in os.listdir(log_dir) if name.endswith('.part')]
+
+    @pytest.mark.parametrize('error_no, expected_status', [
+        (errno.ENOENT, CheckStatus.NOT_FOUND),
+        (errno.EACCES, CheckStatus.ERROR),
+    ])
+    def test_collect_logs_remote_error(self, monitoring_system: MonitoringSystem,
+                                       fake_ssh: FakeSSHClient, error_no, expected_status):
+        """サーバー側の取得エラーをファイル単位の結果とするテスト"""
+        monitoring_system.config['log_collection']['servers'] = [
+            {'name': 'server1', 'host': '127.0.0.1', 'log_paths': ["/var/log/app.log"]}
+        ]
+        fake_ssh.errors["/var/log/app.log"] = IOError(error_no, os.strerror(error_no))
+
+        results = monitoring_system.collect_logs()
+        assert len(results) == 1
+        assert results[0].name == "server1_app.log"
+        assert results[0].status == expected_status
+        assert results[0].details['source_path'] == "/var/log/app.log"
+
+    @pytest.mark.parametrize('error', [
+        FileNotFoundError(errno.ENOENT, 'No such file or directory'),
+        PermissionError(errno.EACCES, 'Permission denied'),
+    ])
+    def test_collect_logs_local_error(self, monitoring_system: MonitoringSystem,
+                                      fake_ssh: FakeSSHClient, error):
+        """ローカル側のI/Oエラーをサーバー単位のエラーとするテスト"""
+        monitoring_system.config['log_collection']['servers'] = [
+            {'name': 'server1', 'host': '127.0.0.1', 'log_paths': ["/var/log/app.log"]}
+        ]
+        fake_ssh.files["/var/log/app.log"] = b"line\n"
+
+        with patch('beaconbase.tempfile.mkstemp', side_effect=error):
+            results = monitoring_system.collect_logs()
+        assert len(results) == 1
+        assert results[0].name == "server1"
+        assert results[0].status == CheckStatus.ERROR
+        assert results[0].details['status'] == 'error'
+
+    def test_docker_container_not_found(self, monitoring_system: MonitoringSystem,
+                                        fake_ssh: FakeSSHClient):
+        """存在しないコンテナの確認テスト"""
+        # docker inspect は存在しないコンテナを出力しない
+        results = monitoring_system.check_docker_containers()
+        assert len(results) == 1
+        assert results[0].status == CheckStatus.NOT_FOUND
+        assert results[0].details['status'] == 'NOT_FOUND'
+        assert fake_ssh.commands[0].startswith('docker inspect')
 
     def test_web_health_check(self, monitoring_system: MonitoringSystem):
         """Webヘルスチェック機能のテスト"""
-        with patch('requests.get') as mock_get:
+        with patch.object(httpx.Client, 'get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.elapsed.total_seconds.return_value = 0.5
@@ -186,8 +542,8 @@ class TestMonitoringSystem:
 
     def test_web_health_check_error(self, monitoring_system: MonitoringSystem):
         """Webヘルスチェックのエラー処理テスト"""
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = requests.exceptions.Timeout("Connection timed out")
+        with patch.object(httpx.Client, 'get') as mock_get:
+            mock_get.side_effect = httpx.TimeoutException("Connection timed out")
 
             results = monitoring_system.check_web_health()
             assert len(results) == 1
@@ -197,6 +553,56 @@ class TestMonitoringSystem:
             assert 'error' in results[0].details
             assert 'Connection timed out' in results[0].details['error']
 
+    def test_web_health_check_host_down(self, monitoring_system: MonitoringSystem):
+        """接続できなかったホストへの再接続を控えるテスト"""
+        with patch.object(httpx.Client, 'get') as mock_get:
+            mock_get.side_effect = httpx.ConnectTimeout("Connection timed out")
+
+            results = monitoring_system.check_web_health()
+            assert results[0].status == CheckStatus.ERROR
+            assert mock_get.call_count == 1
+
+            # 期限内は接続せずにエラーとなる
+            results = monitoring_system.check_web_health()
+            assert results[0].status == CheckStatus.ERROR
+            assert 'recently unreachable' in results[0].details['error']
+            assert mock_get.call_count == 1
+
+    def test_http_client_per_origin_limit(self, monitoring_system: MonitoringSystem):
+        """max_connections_per_hostをオリジンごとの上限とするテスト"""
+        get_client = monitoring_system._get_http_client
+        site_a = get_client(max_connections=1, url='https://a.example.com/health')
+        site_b = get_client(max_connections=1, url='https://b.example.com/health')
+        # 別のオリジンは接続数の上限を共有しない
+        assert site_a is not site_b
+        assert get_client(max_connections=1, url='https://a.example.com:443/status') is site_a
+        assert get_client(max_connections=1, url='https://a.example.com:8443/') is not site_a
+        # 上限を指定しない場合は全オリジンで共有する
+        assert get_client(url='https://a.example.com/') is get_client(url='https://b.example.com/')
+
+    def test_web_health_check_refused_port(self, monitoring_system: MonitoringSystem):
+        """接続拒否では同じホストの別ポートへの接続を控えないテスト"""
+        monitoring_system.config['web_health_checks']['targets'] = [
+            {'name': 'refused', 'url': 'http://example.com:8081/'},
+            {'name': 'other-port', 'url': 'http://example.com:8082/'},
+        ]
+
+        def fake_get(url, timeout=None):
+            if ':8081' in url:
+                raise httpx.ConnectError("Connection refused")
+            return Mock(status_code=200, elapsed=Mock(total_seconds=lambda: 0.1))
+
+        with patch.object(httpx.Client, 'get', side_effect=fake_get) as mock_get:
+            results = {r.name: r for r in monitoring_system.check_web_health()}
+            assert results['refused'].status == CheckStatus.ERROR
+            assert results['other-port'].status == CheckStatus.OK
+
+            # 接続拒否は記録されず、次回も接続を試みる
+            results = {r.name: r for r in monitoring_system.check_web_health()}
+            assert 'recently unreachable' not in str(results['refused'].details)
+            assert results['other-port'].status == CheckStatus.OK
+            assert mock_get.call_count == 4
+
     def test_update_summary(self, monitoring_system: MonitoringSystem, temp_dir):
         """サマリー更新機能のテスト"""
         monitoring_system.config['storage']['output_folder'] = temp_dir
@@ -219,17 +625,154 @@ class TestMonitoringSystem:
         monitoring_system._update_summary('web_health', test_data)
         
         # サマリーファイルの確認
-        summary_path = os.path.join(temp_dir, 'monitoring_summary.json')
+        summary_path = os.path.join(temp_dir, 'summary', 'web_health.json')
+        index_path = os.path.join(temp_dir, 'summary', 'index.json')
         assert os.path.exists(summary_path)
         
         with open(summary_path) as f:
             content = json.load(f)
-            assert 'web_health' in content
-            assert len(content['web_health']) == 1
-            assert content['web_health'][0]['name'] == 'test-website'
-            assert content['web_health'][0]['status'] == 'OK'
-            assert content['web_health'][0]['details']['response_code'] == 200
-            assert content['web_health'][0]['details']['response_time'] == 0.5
+            assert len(content) == 1
+            assert content[0]['name'] == 'test-website'
+            assert content[0]['status'] == 'OK'
+            assert content[0]['details']['response_code'] == 200
+            assert content[0]['details']['response_time'] == 0.5
+            assert content[0]['timestamp'] == test_data[0].timestamp
+
+        with open(index_path) as f:
+            index = json.load(f)
+            assert 'hash' in index['web_health']
+            assert 'last_updated' in index['web_health']
+
+        # 内容が変わらなければ書き込まない
+        mtime = os.stat(summary_path).st_mtime_ns
+        with patch('beaconbase._atomic_write_bytes') as mock_write:
+            monitoring_system._update_summary('web_health', test_data)
+            mock_write.assert_not_called()
+        assert os.stat(summary_path).st_mtime_ns == mtime
+
+    @pytest.mark.parametrize('content, expected_count, expected_tail', [
+        (b'', 0, []),
+        (b'first\nsecond', 2, [b'first', b'second']),
+        (b'first\nsecond\n', 2, [b'first', b'second']),
+        # LOG_SUMMARY_TAIL_BYTES（8KiB）を超え、LOG_SUMMARY_TAIL_LINES（50行）より多い
+        (
+            b''.join(b'line %04d\n' % i for i in range(3000)),
+            3000,
+            [b'line %04d' % i for i in range(2950, 3000)],
+        ),
+    ], ids=['empty', 'no-trailing-newline', 'trailing-newline', 'large'])
+    def test_read_log_stats(self, monitoring_system: MonitoringSystem, tmp_path,
+                            content: bytes, expected_count: int, expected_tail):
+        """ログファイルの行数と末尾の行の取得テスト"""
+        path = tmp_path / 'test.log'
+        path.write_bytes(content)
+
+        line_count, tail = monitoring_system._read_log_stats(str(path))
+        assert line_count == expected_count
+        assert tail == expected_tail
+
+        # 行がチャンクの境界をまたぐ場合も同じ結果となる
+        monitoring_system.LOG_COUNT_CHUNK_SIZE = 7
+        line_count, tail = monitoring_system._read_log_stats(str(path))
+        assert line_count == expected_count
+        assert tail == expected_tail
+
+    def test_write_after_output_dir_removed(self, monitoring_system: MonitoringSystem, temp_dir):
+        """出力ディレクトリが削除された後の書き込みで作り直すテスト"""
+        monitoring_system.config['storage']['output_folder'] = temp_dir
+        data = [CheckResult(name='test-website', status=CheckStatus.OK,
+                            timestamp=datetime.now().isoformat(), details={})]
+        results = {'web_health': data}
+
+        monitoring_system._save_results(data, 'web_health')
+        monitoring_system._write_check_summary(results)
+        monitoring_system._update_summary('web_health', data)
+
+        # 実行中に出力先が削除される（ログローテーションや手動での整理）
+        for name in os.listdir(temp_dir):
+            path = os.path.join(temp_dir, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+        data = [CheckResult(name='test-website', status=CheckStatus.ERROR,
+                            timestamp=datetime.now().isoformat(), details={})]
+        monitoring_system._save_results(data, 'web_health')
+        monitoring_system._write_check_summary({'web_health': data})
+        monitoring_system._update_summary('web_health', data)
+
+        jsonl_files = os.listdir(os.path.join(temp_dir, 'web_health'))
+        assert len(jsonl_files) == 1
+        with open(os.path.join(temp_dir, 'web_health', jsonl_files[0])) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])['status'] == 'ERROR'
+        assert os.path.isfile(os.path.join(temp_dir, 'check_summary.json'))
+        assert os.path.isfile(os.path.join(temp_dir, 'summary', 'web_health.json'))
+        assert os.path.isfile(os.path.join(temp_dir, 'summary', 'index.json'))
+
+    def test_run_all_checks_timestamp(self, monitoring_system: MonitoringSystem, temp_dir):
+        """1回の監視で共通のタイムスタンプが使われることのテスト"""
+        monitoring_system.config['storage']['output_folder'] = temp_dir
+
+        def check_ping():
+            return [monitoring_system._mk_result('test-router', CheckStatus.OK, {})]
+
+        with patch.object(monitoring_system, 'check_ping', side_effect=check_ping), \
+                patch.object(monitoring_system, 'collect_logs', return_value=[]), \
+                patch.object(monitoring_system, 'check_docker_containers', return_value=[]), \
+                patch.object(monitoring_system, 'check_web_health', return_value=[]):
+            results = monitoring_system.run_all_checks()
+
+        timestamp = results['ping'][0].timestamp
+        with open(os.path.join(temp_dir, 'check_summary.json')) as f:
+            assert json.load(f)['timestamp'] == timestamp
+        date = datetime.fromisoformat(timestamp).strftime('%Y%m%d')
+        assert os.path.exists(os.path.join(temp_dir, 'ping', f"ping_{date}.jsonl"))
+        monitoring_system.close()
+
+    def test_background_polling(self, monitoring_system: MonitoringSystem):
+        """バックグラウンド監視のテスト"""
+        results = {'ping': []}
+        with patch.object(MonitoringSystem, 'run_all_checks', return_value=results) as mock_run:
+            assert monitoring_system.get_cached_results() is None
+
+            monitoring_system.start_background(interval=60)
+            assert monitoring_system.first_poll_event.wait(timeout=5)
+            assert monitoring_system.get_cached_results() is results
+
+            # 停止は待機中の間隔を待たずに完了する
+            monitoring_system.stop_background()
+            assert mock_run.call_count == 1
+
+    def test_retry_operation(self, monitoring_system: MonitoringSystem):
+        """リトライ処理のテスト"""
+        operation = Mock(side_effect=[RetryableError("temporary"), "ok"])
+        with patch.object(monitoring_system._stop_event, 'wait', return_value=False) as mock_wait:
+            assert monitoring_system.retry_operation(operation) == "ok"
+            assert operation.call_count == 2
+            delay = mock_wait.call_args[0][0]
+            assert 0.5 * monitoring_system.retry_delay <= delay <= 1.5 * monitoring_system.retry_delay
+
+        # 停止要求中は待機せずに最後のエラーを送出する
+        monitoring_system._stop_event.set()
+        operation = Mock(side_effect=RetryableError("down"))
+        with pytest.raises(RetryableError):
+            monitoring_system.retry_operation(operation)
+        assert operation.call_count == 1
+
+    def test_retry_operation_after_stop_background(self, monitoring_system: MonitoringSystem):
+        """バックグラウンド監視の停止後もリトライするテスト"""
+        monitoring_system.retry_delay = 0
+        with patch.object(monitoring_system, 'run_all_checks', return_value={}):
+            monitoring_system.start_background(interval=60)
+            assert monitoring_system.first_poll_event.wait(5)
+            monitoring_system.stop_background()
+
+        operation = Mock(side_effect=[RetryableError("temporary"), "ok"])
+        assert monitoring_system.retry_operation(operation) == "ok"
+        assert operation.call_count == 2
 
     def test_validate_config_web_health(self, monitoring_system: MonitoringSystem):
         """Webヘルスチェック設定の検証テスト"""
@@ -328,3 +871,30 @@ class TestMonitoringSystem:
             assert len(results) == 1
             assert results[0].status == CheckStatus.OK
             assert results[0].details['server_file_status'] == 'preserved'
+
+
+class TestMonitoringCLI:
+    """MonitoringCLIクラスのテスト"""
+
+    @pytest.mark.parametrize('status, expected', [
+        (CheckStatus.ERROR, MonitoringCLI.EXIT_MONITORING_ERROR),
+        (CheckStatus.NOT_FOUND, MonitoringCLI.EXIT_SUCCESS),
+        (CheckStatus.OK, MonitoringCLI.EXIT_SUCCESS),
+    ])
+    def test_run_exit_code(self, config_file: str, status: CheckStatus, expected: int):
+        """監視結果に応じた終了コードのテスト"""
+        results = {
+            'ping': [CheckResult(name='router', status=CheckStatus.OK,
+                                 timestamp=datetime.now().isoformat(), details={})],
+            'web_health': [CheckResult(name='test-website', status=status,
+                                       timestamp=datetime.now().isoformat(), details={})],
+        }
+        with patch('sys.argv', ['monitor.py', '-c', config_file]), \
+                patch.object(MonitoringSystem, 'run_all_checks', return_value=results):
+            assert MonitoringCLI().run() == expected
+
+    def test_run_config_error(self, temp_dir: str):
+        """設定ファイルを読み込めない場合の終了コードのテスト"""
+        config_path = os.path.join(temp_dir, 'missing.yaml')
+        with patch('sys.argv', ['monitor.py', '-c', config_path]):
+            assert MonitoringCLI().run() == MonitoringCLI.EXIT_ERROR